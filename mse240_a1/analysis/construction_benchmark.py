@@ -0,0 +1,119 @@
+"""
+Import-time and constructor-throughput benchmark for ElectricBike.
+
+Compares the working-tree electric_bike.py against the same file at an
+earlier git revision (default: BASELINE_REV, the last revision before the
+import/construction optimizations). Each measurement runs in a fresh
+interpreter so module caches from one variant never leak into the other:
+
+  - import time: `python -X importtime`, cumulative microseconds for the
+    electric_bike module (includes everything it imports), best of N runs;
+  - construction: `python -m timeit` for a default-argument bike and for a
+    bike with explicit colors/features;
+  - __sizeof__(): `python -m timeit` on an existing bike.
+
+Run from the repository root:
+  python -m mse240_a1.analysis.construction_benchmark [--baseline REV] [--runs N]
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+SOURCE = os.path.join("mse240_a1", "src", "electric_bike.py")
+# electric_bike.py as it was before the import/construction optimizations
+BASELINE_REV = "ed6d3a0aef50fd377abcfce18e0e0b9f4cd1a1b7"
+
+CASES: Dict[str, List[str]] = {
+    "construct (defaults) usec": [
+        "-s", "from electric_bike import ElectricBike",
+        "ElectricBike('Bike', 1000.0, stock=3)",
+    ],
+    "construct (explicit) usec": [
+        "-s", "from electric_bike import ElectricBike",
+        "ElectricBike('Bike', 1000.0, stock=3, available_colors=['a', 'b'],"
+        " selected_color='b', features={'x': True}, battery_wh=500)",
+    ],
+    "__sizeof__ usec": [
+        "-s", "from electric_bike import ElectricBike; b = ElectricBike('Bike', 1.0)",
+        "b.__sizeof__()",
+    ],
+}
+
+
+def _run(src_dir: str, args: List[str]) -> str:
+    env = dict(os.environ, PYTHONPATH=src_dir)
+    # both variants must import from cached bytecode (see measure())
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout + result.stderr
+
+
+def import_usec(src_dir: str, runs: int) -> int:
+    best = None
+    for _ in range(runs):
+        out = _run(src_dir, ["-X", "importtime", "-c", "import electric_bike"])
+        match = re.search(r"\|\s*(\d+)\s*\|\s*electric_bike\s*$", out, re.M)
+        if match is None:
+            raise RuntimeError(f"no importtime line for electric_bike:\n{out}")
+        cumulative = int(match.group(1))
+        best = cumulative if best is None else min(best, cumulative)
+    return best
+
+
+def timeit_usec(src_dir: str, case: List[str]) -> float:
+    out = _run(src_dir, ["-m", "timeit", "-r", "7", *case])
+    match = re.search(r"best of \d+: ([\d.]+) (nsec|usec|msec)", out)
+    if match is None:
+        raise RuntimeError(f"unexpected timeit output:\n{out}")
+    scale = {"nsec": 1e-3, "usec": 1.0, "msec": 1e3}[match.group(2)]
+    return float(match.group(1)) * scale
+
+
+def measure(src_dir: str, runs: int) -> Dict[str, float]:
+    # compile up front so import time excludes compilation for both variants
+    _run(src_dir, ["-m", "py_compile", os.path.join(src_dir, "electric_bike.py")])
+    results: Dict[str, float] = {"import usec": float(import_usec(src_dir, runs))}
+    for label, case in CASES.items():
+        results[label] = timeit_usec(src_dir, case)
+    return results
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--baseline", default=BASELINE_REV, help="git revision to compare"
+    )
+    parser.add_argument("--runs", type=int, default=15, help="import-time runs")
+    args = parser.parse_args(argv)
+
+    old_source = subprocess.run(
+        ["git", "show", f"{args.baseline}:{SOURCE}"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+
+    with tempfile.TemporaryDirectory() as baseline_dir:
+        with open(os.path.join(baseline_dir, "electric_bike.py"), "w") as f:
+            f.write(old_source)
+        before = measure(baseline_dir, args.runs)
+    after = measure(os.path.dirname(SOURCE), args.runs)
+
+    print(
+        f"{'metric':<28}{args.baseline[:10]:>12}{'working tree':>14}{'speedup':>9}"
+    )
+    for label in before:
+        print(
+            f"{label:<28}{before[label]:>12.3f}{after[label]:>14.3f}"
+            f"{before[label] / after[label]:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+Storefront load generator for ElectricBike catalogs.
+
+Builds a synthetic SKU -> ElectricBike catalog and replays a weighted mix of
+storefront reads (get_current_price, get_estimated_range_km, is_active) and
+writes (set_stock, set_discount_percent, color mutators) under one of three
+concurrency models:
+
+  threads    - N threads share one catalog (contends on the GIL)
+  processes  - N processes, each with its own copy of the catalog
+               (writes are not shared between workers)
+  asyncio    - N tasks on one event loop share one catalog; each task yields
+               to the loop every `yield_every` operations
+
+Every model runs the same per-worker operation plans (same seed), and reports
+throughput, latency percentiles for the operation calls themselves, failed
+operations (e.g. two threads racing to remove the same color) and resident
+memory growth (Linux /proc/self/statm; summed over workers for processes).
+
+Run from the repository root:
+  python -m mse240_a1.analysis.load_test --bikes 10000 --workers 4 --ops 50000
+"""
+
+from __future__ import annotations
+from array import array
+import argparse
+import asyncio
+import math
+import multiprocessing
+import multiprocessing.synchronize
+import os
+import random
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from mse240_a1.src.electric_bike import ElectricBike
+
+BASE_COLORS = ["black", "silver", "red", "blue", "green"]
+PROMO_COLOR = "limited edition"
+MODELS = ("threads", "processes", "asyncio")
+
+# operation name -> relative weight; reads dominate, like a storefront
+DEFAULT_MIX: Dict[str, int] = {
+    "get_current_price": 45,
+    "get_estimated_range_km": 20,
+    "is_active": 20,
+    "set_stock": 6,
+    "set_discount_percent": 4,
+    "set_selected_color": 2,
+    "toggle_promo_color": 3,
+}
+
+Plan = List[Tuple[str, str, float]]
+
+
+def build_catalog(n_bikes: int, seed: int = 0) -> Dict[str, ElectricBike]:
+    rng = random.Random(seed)
+    catalog: Dict[str, ElectricBike] = {}
+    for i in range(n_bikes):
+        colors = BASE_COLORS[: rng.randint(2, len(BASE_COLORS))]
+        catalog[f"EB-{i:06d}"] = ElectricBike(
+            f"Model {i}",
+            round(rng.uniform(800.0, 6000.0), 2),
+            stock=rng.randint(0, 40),
+            available_colors=colors,
+            features={"has_rack": rng.random() < 0.5, "has_lights": True},
+            battery_wh=rng.choice((400, 500, 625, 750)),
+            assist_level=rng.randint(1, 5),
+            discount_percent=rng.choice((0.0, 0.0, 0.1, 0.25)),
+        )
+    return catalog
+
+
+def make_plan(
+    skus: Sequence[str], n_ops: int, mix: Dict[str, int], seed: int
+) -> Plan:
+    """Pre-generate (op, sku, argument) so RNG cost is outside the timed loop."""
+    rng = random.Random(seed)
+    names = list(mix)
+    chosen = rng.choices(names, weights=[mix[n] for n in names], k=n_ops)
+    plan: Plan = []
+    for op in chosen:
+        sku = skus[rng.randrange(len(skus))]
+        if op == "get_estimated_range_km":
+            arg = rng.uniform(55.0, 110.0)
+        elif op == "set_stock":
+            arg = rng.randint(0, 40)
+        elif op == "set_discount_percent":
+            arg = rng.choice((0.0, 0.05, 0.1, 0.2))
+        else:
+            arg = rng.random()
+        plan.append((op, sku, arg))
+    return plan
+
+
+def _apply(bike: ElectricBike, op: str, arg: float) -> None:
+    if op == "get_current_price":
+        bike.get_current_price()
+    elif op == "get_estimated_range_km":
+        bike.get_estimated_range_km(arg)
+    elif op == "is_active":
+        bike.is_active()
+    elif op == "set_stock":
+        bike.set_stock(arg)
+    elif op == "set_discount_percent":
+        bike.set_discount_percent(arg)
+    elif op == "set_selected_color":
+        # base colors only, so the promo color is never selected (removable)
+        colors = [c for c in bike.get_available_colors() if c != PROMO_COLOR]
+        bike.set_selected_color(colors[int(arg * len(colors))])
+    elif op == "toggle_promo_color":
+        if PROMO_COLOR in bike.get_available_colors():
+            bike.remove_color(PROMO_COLOR)
+        else:
+            bike.add_color(PROMO_COLOR)
+    else:
+        raise ValueError(f"unknown operation: {op!r}")
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _run_plan(
+    catalog: Dict[str, ElectricBike], plan: Plan, latencies: array, offset: int = 0
+) -> int:
+    """
+    Execute a plan, writing per-op nanoseconds into the preallocated
+    `latencies` from `offset` on (so the harness does not allocate while it
+    measures memory). Returns the failed op count.
+    """
+    clock = time.perf_counter_ns
+    errors = 0
+    i = offset
+    for op, sku, arg in plan:
+        bike = catalog[sku]
+        start = clock()
+        try:
+            _apply(bike, op, arg)
+        except (ValueError, TypeError):
+            errors += 1
+        latencies[i] = clock() - start
+        i += 1
+    return errors
+
+
+async def _run_plan_async(
+    catalog: Dict[str, ElectricBike],
+    plan: Plan,
+    latencies: array,
+    yield_every: int,
+) -> int:
+    errors = 0
+    for start in range(0, len(plan), yield_every):
+        errors += _run_plan(
+            catalog, plan[start : start + yield_every], latencies, start
+        )
+        await asyncio.sleep(0)
+    return errors
+
+
+def _new_latencies(n: int) -> array:
+    return array("q", bytes(8 * n))
+
+
+_start_barrier = None
+
+
+def _init_process_worker(barrier: multiprocessing.synchronize.Barrier) -> None:
+    global _start_barrier
+    _start_barrier = barrier
+
+
+def _process_worker(
+    args: Tuple[int, int, int, Dict[str, int]]
+) -> Tuple[array, int, int, float, float]:
+    n_bikes, n_ops, seed, mix = args
+    catalog = build_catalog(n_bikes, seed=0)
+    plan = make_plan(list(catalog), n_ops, mix, seed)
+    latencies = _new_latencies(n_ops)
+    rss_before = _rss_bytes()
+    # start the timed section together; time.monotonic() is system-wide
+    _start_barrier.wait()
+    start = time.monotonic()
+    errors = _run_plan(catalog, plan, latencies)
+    end = time.monotonic()
+    return latencies, errors, _rss_bytes() - rss_before, start, end
+
+
+def percentile(sorted_values: Sequence[int], pct: float) -> int:
+    """Nearest-rank percentile of an ascending sequence (pct in [0, 100])."""
+    if not sorted_values:
+        raise ValueError("no values")
+    if not (0.0 <= pct <= 100.0):
+        raise ValueError("pct must be in [0, 100]")
+    rank = max(1, math.ceil(len(sorted_values) * pct / 100.0))
+    return sorted_values[rank - 1]
+
+
+def run_model(
+    model: str,
+    *,
+    n_bikes: int = 1000,
+    workers: int = 4,
+    ops_per_worker: int = 10_000,
+    mix: Dict[str, int] | None = None,
+    seed: int = 1,
+    yield_every: int = 32,
+) -> Dict[str, float]:
+    """Run one concurrency model and return its metrics."""
+    if model not in MODELS:
+        raise ValueError(f"model must be one of {MODELS}")
+    if workers < 1 or ops_per_worker < 1 or n_bikes < 1 or yield_every < 1:
+        raise ValueError(
+            "n_bikes, workers, ops_per_worker and yield_every must be positive"
+        )
+    mix = dict(mix or DEFAULT_MIX)
+    seeds = [seed + w for w in range(workers)]
+
+    if model == "processes":
+        jobs = [(n_bikes, ops_per_worker, s, mix) for s in seeds]
+        barrier = multiprocessing.Barrier(workers)
+        with multiprocessing.Pool(
+            workers, initializer=_init_process_worker, initargs=(barrier,)
+        ) as pool:
+            results = pool.map(_process_worker, jobs, chunksize=1)
+        # timed section only: excludes pool start-up and per-worker catalog build
+        wall = max(r[4] for r in results) - min(r[3] for r in results)
+        latencies = [ns for r in results for ns in r[0]]
+        errors = sum(r[1] for r in results)
+        rss_growth = sum(r[2] for r in results)
+    else:
+        catalog = build_catalog(n_bikes, seed=0)
+        plans = [make_plan(list(catalog), ops_per_worker, mix, s) for s in seeds]
+        per_worker = [_new_latencies(ops_per_worker) for _ in seeds]
+        rss_before = _rss_bytes()
+        start = time.perf_counter()
+        if model == "threads":
+            error_counts = [0] * workers
+
+            def work(i: int) -> None:
+                error_counts[i] = _run_plan(catalog, plans[i], per_worker[i])
+
+            threads = [threading.Thread(target=work, args=(i,)) for i in range(workers)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            errors = sum(error_counts)
+        else:
+
+            async def main() -> List[int]:
+                return await asyncio.gather(
+                    *(
+                        _run_plan_async(catalog, plans[i], per_worker[i], yield_every)
+                        for i in range(workers)
+                    )
+                )
+
+            errors = sum(asyncio.run(main()))
+        wall = time.perf_counter() - start
+        rss_growth = _rss_bytes() - rss_before
+        latencies = [ns for lat in per_worker for ns in lat]
+
+    latencies.sort()
+    return {
+        "ops": len(latencies),
+        "errors": errors,
+        "seconds": wall,
+        "ops_per_sec": len(latencies) / wall,
+        "p50_us": percentile(latencies, 50) / 1000.0,
+        "p99_us": percentile(latencies, 99) / 1000.0,
+        "p999_us": percentile(latencies, 99.9) / 1000.0,
+        "max_us": latencies[-1] / 1000.0,
+        "rss_growth_kib": rss_growth / 1024.0,
+    }
+
+
+def format_report(results: Dict[str, Dict[str, float]]) -> str:
+    columns: List[Tuple[str, str, Callable[[float], str]]] = [
+        ("ops", "ops", lambda v: f"{int(v)}"),
+        ("errors", "errors", lambda v: f"{int(v)}"),
+        ("ops/s", "ops_per_sec", lambda v: f"{v:,.0f}"),
+        ("p50 us", "p50_us", lambda v: f"{v:.2f}"),
+        ("p99 us", "p99_us", lambda v: f"{v:.2f}"),
+        ("p99.9 us", "p999_us", lambda v: f"{v:.2f}"),
+        ("max us", "max_us", lambda v: f"{v:.1f}"),
+        ("RSS +KiB", "rss_growth_kib", lambda v: f"{v:,.0f}"),
+    ]
+    lines = [f"{'model':<11}" + "".join(f"{title:>13}" for title, _, _ in columns)]
+    for model, metrics in results.items():
+        lines.append(
+            f"{model:<11}"
+            + "".join(f"{fmt(metrics[key]):>13}" for _, key, fmt in columns)
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="ElectricBike storefront load test")
+    parser.add_argument("--bikes", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--ops", type=int, default=50_000, help="operations per worker")
+    parser.add_argument("--models", nargs="+", choices=MODELS, default=list(MODELS))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--yield-every", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    results = {
+        model: run_model(
+            model,
+            n_bikes=args.bikes,
+            workers=args.workers,
+            ops_per_worker=args.ops,
+            seed=args.seed,
+            yield_every=args.yield_every,
+        )
+        for model in args.models
+    }
+    print(
+        f"{args.bikes} bikes, {args.workers} workers x {args.ops} ops, "
+        f"python {'.'.join(map(str, sys.version_info[:3]))}"
+    )
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Serialization benchmark for ElectricBike.
+
+Compares payload size and encode/decode time of:
+  - plain pickle of each bike's full __dict__ (the behaviour before
+    __getstate__/__setstate__ were added),
+  - pickle using ElectricBike.__getstate__ (compact positional state),
+  - dumps_bikes()/loads_bikes() (binary, shared string table),
+  - dumps_bikes_json()/loads_bikes_json() (JSON, shared string table).
+
+Run from the repository root:
+  python -m mse240_a1.analysis.serialization_benchmark [n_bikes]
+"""
+
+from __future__ import annotations
+import pickle
+import sys
+import timeit
+from typing import Callable, List, Tuple
+
+from mse240_a1.src.electric_bike import (
+    ElectricBike,
+    dumps_bikes,
+    dumps_bikes_json,
+    loads_bikes,
+    loads_bikes_json,
+)
+
+COLORS = ["black", "silver", "red", "blue", "green", "matte grey"]
+FEATURES = ["has_rack", "has_lights", "has_fenders", "has_kickstand", "has_lock"]
+
+
+def make_catalog(n: int) -> List[ElectricBike]:
+    bikes = []
+    for i in range(n):
+        colors = COLORS[: 2 + i % (len(COLORS) - 1)]
+        bikes.append(
+            ElectricBike(
+                f"Model {i:05d}",
+                999.99 + i,
+                stock=i % 17,
+                available_colors=colors,
+                selected_color=colors[i % len(colors)],
+                features={f: (i + j) % 2 == 0 for j, f in enumerate(FEATURES)},
+                battery_wh=400 + 50 * (i % 5),
+                assist_level=1 + i % 5,
+                discount_percent=(i % 4) * 0.05,
+            )
+        )
+    return bikes
+
+
+class _DictBike:
+    """Same attributes as ElectricBike, default (pre-__getstate__) pickling."""
+
+
+def _as_dict_bikes(bikes: List[ElectricBike]) -> List[_DictBike]:
+    plain = []
+    for b in bikes:
+        d = _DictBike.__new__(_DictBike)
+        d.__dict__.update(b.__dict__)
+        plain.append(d)
+    return plain
+
+
+def _pickle_dumps(bikes: List) -> bytes:
+    return pickle.dumps(bikes, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+# (label, encode, decode, encodes _DictBike copies instead of ElectricBike)
+CODECS: List[Tuple[str, Callable, Callable, bool]] = [
+    ("pickle (__dict__)", _pickle_dumps, pickle.loads, True),
+    ("pickle (__getstate__)", _pickle_dumps, pickle.loads, False),
+    ("dumps_bikes", dumps_bikes, loads_bikes, False),
+    ("dumps_bikes_json", dumps_bikes_json, loads_bikes_json, False),
+]
+
+
+def _best_ms(fn: Callable[[], object], repeat: int = 9) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000.0
+
+
+def main(n: int = 10_000) -> None:
+    catalog = make_catalog(n)
+    plain = _as_dict_bikes(catalog)
+    print(f"{n} bikes")
+    print(f"{'codec':<22}{'bytes':>12}{'B/bike':>9}{'encode ms':>12}{'decode ms':>12}")
+    for label, dumps, loads, use_plain in CODECS:
+        bikes = plain if use_plain else catalog
+        payload = dumps(bikes)
+        decoded = loads(payload)
+        assert [b.__dict__ for b in decoded] == [b.__dict__ for b in catalog], label
+        enc = _best_ms(lambda: dumps(bikes))
+        dec = _best_ms(lambda: loads(payload))
+        print(
+            f"{label:<22}{len(payload):>12}{len(payload) / n:>9.1f}"
+            f"{enc:>12.2f}{dec:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,264 @@
+"""
+BikeCache: read-through LRU cache of ElectricBike objects keyed by SKU.
+
+Description:
+  Bikes are materialized on demand from a pluggable bulk loader,
+  `loader(skus) -> {sku: ElectricBike}`, which stands in for the backing
+  database. SKUs the loader does not return are treated as unknown.
+
+  - Eviction is least-recently-used, bounded by entry count (`max_entries`),
+    by bytes (`max_bytes`, measured with sys.getsizeof(), i.e. the bike's
+    __sizeof__() plus GC header, when the bike is loaded), or both.
+  - get_many() turns all of its misses into loader calls of at most
+    `max_batch` SKUs instead of one call per SKU.
+  - Concurrent misses on the same SKU are coalesced: the first caller loads,
+    the others wait for its result, so a hot SKU falling out of the cache
+    costs one backend load rather than one per request (no stampede).
+
+Output:
+  get() raises ValueError for unknown SKUs; get_many() omits them. Loader
+  exceptions (and TypeError for a loader that does not return a mapping of
+  ElectricBikes) propagate to the loading caller and to everyone waiting on
+  it, and nothing from the failed batch is cached. invalidate() during a
+  load keeps that load's (possibly outdated) result out of the cache.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+import sys
+import threading
+
+from mse240_a1.src.electric_bike import ElectricBike
+
+BikeLoader = Callable[[Sequence[str]], Mapping[str, ElectricBike]]
+
+
+class _PendingLoad:
+    """A load in progress that other threads can wait on."""
+
+    __slots__ = ("done", "bike", "error", "stale")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.bike: ElectricBike | None = None
+        self.error: BaseException | None = None
+        # set by invalidate()/clear() while loading: the result may predate
+        # the backend update, so it is handed to waiters but not cached
+        self.stale = False
+
+
+class InMemoryBikeLoader:
+    """
+    In-process fake backing store for BikeCache (tests, benchmarks, demos).
+
+    Counts calls and requested SKUs so callers can check batching, and can
+    run an optional `on_load` hook (e.g. a sleep or barrier) inside each call.
+    """
+
+    def __init__(
+        self,
+        bikes: Mapping[str, ElectricBike],
+        *,
+        on_load: Callable[[Sequence[str]], None] | None = None,
+    ) -> None:
+        self._bikes: Dict[str, ElectricBike] = dict(bikes)
+        self._on_load = on_load
+        self._lock = threading.Lock()
+        self.calls: List[Tuple[str, ...]] = []
+
+    def __call__(self, skus: Sequence[str]) -> Dict[str, ElectricBike]:
+        with self._lock:
+            self.calls.append(tuple(skus))
+        if self._on_load is not None:
+            self._on_load(skus)
+        return {s: self._bikes[s] for s in skus if s in self._bikes}
+
+
+class BikeCache:
+    """Read-through LRU cache in front of a bulk bike loader."""
+
+    def __init__(
+        self,
+        loader: BikeLoader,
+        *,
+        max_entries: int | None = 1024,
+        max_bytes: int | None = None,
+        max_batch: int = 256,
+    ) -> None:
+        if not callable(loader):
+            raise TypeError("loader must be callable")
+        if max_entries is None and max_bytes is None:
+            raise ValueError("at least one of max_entries or max_bytes is required")
+        if max_entries is not None and (
+            not isinstance(max_entries, int) or max_entries < 1
+        ):
+            raise ValueError("max_entries must be a positive int")
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 1):
+            raise ValueError("max_bytes must be a positive int")
+        if not isinstance(max_batch, int) or max_batch < 1:
+            raise ValueError("max_batch must be a positive int")
+
+        self._loader = loader
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._max_batch = max_batch
+
+        self._lock = threading.Lock()
+        # sku -> (bike, bytes charged against max_bytes); order is LRU -> MRU
+        self._entries: OrderedDict[str, Tuple[ElectricBike, int]] = OrderedDict()
+        self._inflight: Dict[str, _PendingLoad] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._evictions = 0
+
+    # -- Getter functions --
+    def get(self, sku: str) -> ElectricBike:
+        bike = self.get_many((sku,)).get(sku)
+        if bike is None:
+            raise ValueError(f"unknown sku: {sku!r}")
+        return bike
+
+    def get_many(self, skus: Iterable[str]) -> Dict[str, ElectricBike]:
+        """Return {sku: bike} for every known SKU, loading misses in bulk."""
+        found: Dict[str, ElectricBike] = {}
+        to_load: List[str] = []
+        waiting: List[Tuple[str, _PendingLoad]] = []
+
+        with self._lock:
+            for sku in dict.fromkeys(skus):
+                entry = self._entries.get(sku)
+                if entry is not None:
+                    self._entries.move_to_end(sku)
+                    found[sku] = entry[0]
+                    self._hits += 1
+                    continue
+                self._misses += 1
+                pending = self._inflight.get(sku)
+                if pending is None:
+                    self._inflight[sku] = _PendingLoad()
+                    to_load.append(sku)
+                else:
+                    waiting.append((sku, pending))
+
+        for start in range(0, len(to_load), self._max_batch):
+            try:
+                self._load(to_load[start : start + self._max_batch], found)
+            except BaseException as exc:
+                # release waiters on the batches this call will never load
+                self._fail(to_load[start + self._max_batch :], exc)
+                raise
+
+        for sku, pending in waiting:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            if pending.bike is not None:
+                found[sku] = pending.bike
+        return found
+
+    def __contains__(self, sku: object) -> bool:
+        """True if `sku` is cached right now (does not load or touch LRU order)."""
+        return sku in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_bytes(self) -> int:
+        return self._bytes
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "loads": self._loads,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    # -- Mutator functions --
+    def invalidate(self, sku: str) -> None:
+        """
+        Drop `sku` so the next get() reloads it from the backing store. A load
+        of `sku` already in flight is not cached when it completes.
+        """
+        with self._lock:
+            entry = self._entries.pop(sku, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+            pending = self._inflight.get(sku)
+            if pending is not None:
+                pending.stale = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for pending in self._inflight.values():
+                pending.stale = True
+
+    # -- Loading and eviction --
+    def _load(self, batch: List[str], found: Dict[str, ElectricBike]) -> None:
+        # Any failure, in the loader or in the bookkeeping below, must still
+        # release every SKU of the batch, or its waiters block forever.
+        try:
+            loaded = self._loader(batch)
+            if not isinstance(loaded, Mapping):
+                raise TypeError(
+                    f"loader must return a mapping, not {type(loaded).__name__}"
+                )
+            # validate and size the whole batch before caching any of it
+            results: List[Tuple[str, ElectricBike | None, int]] = []
+            for sku in batch:
+                bike = loaded.get(sku)
+                if bike is None:
+                    results.append((sku, None, 0))
+                    continue
+                if not isinstance(bike, ElectricBike):
+                    raise TypeError(
+                        f"loader returned {type(bike).__name__} for {sku!r}, "
+                        "not an ElectricBike"
+                    )
+                results.append((sku, bike, sys.getsizeof(bike)))
+
+            with self._lock:
+                self._loads += 1
+                try:
+                    for sku, bike, size in results:
+                        pending = self._inflight.pop(sku)
+                        if bike is not None:
+                            if not pending.stale:
+                                self._entries[sku] = (bike, size)
+                                self._bytes += size
+                            found[sku] = bike
+                        pending.bike = bike
+                        pending.done.set()
+                finally:
+                    self._evict()
+        except BaseException as exc:
+            self._fail(batch, exc)
+            raise
+
+    def _fail(self, batch: List[str], exc: BaseException) -> None:
+        with self._lock:
+            for sku in batch:
+                # SKUs already resolved by a partly finished load are skipped
+                pending = self._inflight.pop(sku, None)
+                if pending is not None:
+                    pending.error = exc
+                    pending.done.set()
+
+    def _evict(self) -> None:
+        # caller holds self._lock
+        entries = self._entries
+        while entries and (
+            (self._max_entries is not None and len(entries) > self._max_entries)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            _, (_, size) = entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
@@ -0,0 +1,370 @@
+"""
+CatalogStore: persistent, SKU-keyed ElectricBike catalog.
+
+Description:
+  Keeps the catalog in memory and persists it as a snapshot file plus an
+  append-only write-ahead log (WAL) in one directory:
+
+    catalog.snap  - generation + SKU list + dumps_bikes() payload,
+                    replaced atomically
+    catalog.wal   - generation + framed records for put/remove/set_stock/
+                    set_price/set_discount_percent applied since the snapshot
+
+  Updates are applied to the in-memory bike first (so the usual
+  ValueError/TypeError validation happens before anything is logged), then
+  buffered. The buffer is written and fsync'd as one group, either when it
+  reaches `group_commit_ops` records or on flush()/close(), so a burst of
+  updates costs one fsync instead of one per operation. Records still in the
+  buffer are lost on a crash; call flush() where an update must be durable.
+
+  Replaying a WAL on top of a snapshot that already contains its effects is
+  not safe (a later snapshot may have dropped a SKU the WAL still updates), so
+  both files carry a generation number. compact() writes the snapshot with the
+  next generation, then replaces the WAL with an empty one of that generation.
+  On open, a WAL older than the snapshot is one whose records the snapshot
+  already holds (a crash between those two steps) and is discarded unread.
+
+Output:
+  Raises ValueError for unknown SKUs, corrupt snapshots, WAL records that do
+  not match the snapshot, and values the snapshot format cannot hold (NaN or
+  infinite prices/discounts, stock above 2**32 - 1), which are rejected
+  before they are applied or logged. A torn or corrupt WAL tail (e.g. power
+  loss mid-write) is discarded on open.
+"""
+
+from __future__ import annotations
+from typing import Dict, List
+import json
+import math
+import os
+import struct
+import threading
+import zlib
+
+from mse240_a1.src.electric_bike import ElectricBike, dumps_bikes, loads_bikes
+
+SNAPSHOT_NAME = "catalog.snap"
+WAL_NAME = "catalog.wal"
+
+_OP_PUT = 1
+_OP_REMOVE = 2
+_OP_STOCK = 3
+_OP_PRICE = 4
+_OP_DISCOUNT = 5
+
+# snapshot: magic, generation, sku JSON length | sku JSON | dumps_bikes()
+_SNAP_HEAD = struct.Struct("<4sQI")
+_SNAP_MAGIC = b"EBSN"
+# WAL: magic, generation | frames
+_WAL_HEAD = struct.Struct("<4sQ")
+_WAL_MAGIC = b"EBWL"
+# frame: body length, crc32(body) | body: op, sku length, sku, payload
+_FRAME = struct.Struct("<II")
+_BODY_HEAD = struct.Struct("<BH")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+# snapshot records store stock as u32 (see electric_bike._RECORD)
+_MAX_STOCK = 2**32 - 1
+
+
+def _check_storable(setter: str, value: object) -> None:
+    """
+    Reject values a setter accepts but a snapshot cannot hold, so a logged
+    update never breaks the next compact() or reopen.
+    """
+    if setter == "set_stock":
+        if isinstance(value, int) and value > _MAX_STOCK:
+            raise ValueError(f"{setter} value must be at most {_MAX_STOCK}")
+    elif isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"{setter} value must be finite")
+
+
+def _encode(op: int, sku: str, payload: bytes = b"") -> bytes:
+    raw_sku = sku.encode("utf-8")
+    body = _BODY_HEAD.pack(op, len(raw_sku)) + raw_sku + payload
+    return _FRAME.pack(len(body), zlib.crc32(body)) + body
+
+
+class CatalogStore:
+    """
+    In-memory catalog backed by a snapshot + write-ahead log.
+
+    Use as a context manager, or call close() to flush the last group.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        group_commit_ops: int = 512,
+        compact_wal_bytes: int = 16 * 1024 * 1024,
+        fsync: bool = True,
+    ) -> None:
+        if not isinstance(group_commit_ops, int) or group_commit_ops < 1:
+            raise ValueError("group_commit_ops must be a positive int")
+        if not isinstance(compact_wal_bytes, int) or compact_wal_bytes < 1:
+            raise ValueError("compact_wal_bytes must be a positive int")
+
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._snap_path = os.path.join(directory, SNAPSHOT_NAME)
+        self._wal_path = os.path.join(directory, WAL_NAME)
+        self._group_commit_ops = group_commit_ops
+        self._compact_wal_bytes = compact_wal_bytes
+        self._fsync = fsync
+
+        # _lock guards the catalog and pending buffer; _io_lock serializes
+        # file writes so other threads keep buffering during an fsync.
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._pending: List[bytes] = []
+        self._catalog: Dict[str, ElectricBike] = {}
+
+        self._generation = self._load_snapshot()
+        self._wal_bytes = self._replay_wal()
+        self._wal = open(self._wal_path, "ab")
+
+    # -- Recovery --
+    def _load_snapshot(self) -> int:
+        """Load the snapshot, if any. Returns its generation (0 if none)."""
+        try:
+            with open(self._snap_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        try:
+            magic, generation, sku_len = _SNAP_HEAD.unpack_from(data, 0)
+            if magic != _SNAP_MAGIC:
+                raise ValueError("bad magic")
+            start = _SNAP_HEAD.size
+            skus = json.loads(data[start : start + sku_len])
+        except (struct.error, ValueError) as exc:
+            raise ValueError(f"corrupt snapshot: {self._snap_path}") from exc
+        bikes = loads_bikes(data[start + sku_len :])
+        if len(skus) != len(bikes):
+            raise ValueError(f"corrupt snapshot: {self._snap_path}")
+        self._catalog = dict(zip(skus, bikes))
+        return generation
+
+    def _replay_wal(self) -> int:
+        """
+        Apply logged records of the snapshot's generation; truncate any torn
+        tail. Returns the length of the valid records (header excluded).
+        """
+        try:
+            with open(self._wal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        if len(data) < _WAL_HEAD.size:
+            # new store, or a WAL rotation that never completed
+            self._new_wal(self._generation)
+            return 0
+        magic, generation = _WAL_HEAD.unpack_from(data, 0)
+        if magic != _WAL_MAGIC:
+            raise ValueError(f"corrupt WAL header: {self._wal_path}")
+        if generation > self._generation:
+            raise ValueError(
+                f"WAL generation {generation} is newer than the snapshot's "
+                f"({self._generation}): {self._wal_path}"
+            )
+        if generation < self._generation:
+            # compact() stopped after replacing the snapshot; these records
+            # are already in it
+            self._new_wal(self._generation)
+            return 0
+
+        offset = _WAL_HEAD.size
+        end = len(data)
+        while offset + _FRAME.size <= end:
+            length, crc = _FRAME.unpack_from(data, offset)
+            start = offset + _FRAME.size
+            body = data[start : start + length]
+            if len(body) != length or zlib.crc32(body) != crc:
+                break
+            op, sku_len = _BODY_HEAD.unpack_from(body, 0)
+            sku = body[_BODY_HEAD.size : _BODY_HEAD.size + sku_len].decode("utf-8")
+            self._apply(op, sku, body[_BODY_HEAD.size + sku_len :])
+            offset = start + length
+
+        if offset != end:
+            with open(self._wal_path, "r+b") as f:
+                f.truncate(offset)
+        return offset - _WAL_HEAD.size
+
+    def _apply(self, op: int, sku: str, payload: bytes) -> None:
+        if op == _OP_PUT:
+            self._catalog[sku] = ElectricBike.from_bytes(payload)
+            return
+        if op == _OP_REMOVE:
+            self._catalog.pop(sku, None)
+            return
+        bike = self._catalog.get(sku)
+        if bike is None:
+            raise ValueError(f"WAL record for unknown sku: {sku!r}")
+        if op == _OP_STOCK:
+            bike.set_stock(_I64.unpack(payload)[0])
+        elif op == _OP_PRICE:
+            bike.set_price(_F64.unpack(payload)[0])
+        elif op == _OP_DISCOUNT:
+            bike.set_discount_percent(_F64.unpack(payload)[0])
+        else:
+            raise ValueError(f"unknown WAL op code {op}")
+
+    # -- Getter functions --
+    def get(self, sku: str) -> ElectricBike:
+        """
+        Return the live bike for `sku`. Mutate it through the store's
+        setters; direct setter calls on the bike are not journaled.
+        """
+        try:
+            return self._catalog[sku]
+        except KeyError:
+            raise ValueError(f"unknown sku: {sku!r}") from None
+
+    def skus(self) -> List[str]:
+        with self._lock:
+            return list(self._catalog)
+
+    def __contains__(self, sku: object) -> bool:
+        return sku in self._catalog
+
+    def __len__(self) -> int:
+        return len(self._catalog)
+
+    def get_wal_bytes(self) -> int:
+        """Bytes of WAL records (file header excluded) plus records still buffered."""
+        with self._lock:
+            return self._wal_bytes + sum(len(r) for r in self._pending)
+
+    # -- Setter functions --
+    def put(self, sku: str, bike: ElectricBike) -> None:
+        if not isinstance(sku, str) or not sku:
+            raise TypeError("sku must be a non-empty string")
+        if not isinstance(bike, ElectricBike):
+            raise TypeError("bike must be an ElectricBike")
+        payload = bike.to_bytes()
+        # the WAL replays this payload through from_bytes(); a bike that
+        # cannot be decoded (e.g. a NaN price) would make the store unopenable
+        ElectricBike.from_bytes(payload)
+        record = _encode(_OP_PUT, sku, payload)
+        with self._lock:
+            self._catalog[sku] = bike
+            self._pending.append(record)
+        self._maybe_commit()
+
+    def remove(self, sku: str) -> None:
+        with self._lock:
+            if sku not in self._catalog:
+                raise ValueError(f"unknown sku: {sku!r}")
+            del self._catalog[sku]
+            self._pending.append(_encode(_OP_REMOVE, sku))
+        self._maybe_commit()
+
+    def set_stock(self, sku: str, qty: int) -> None:
+        self._update(sku, _OP_STOCK, "set_stock", qty, _I64)
+
+    def set_price(self, sku: str, price: float) -> None:
+        self._update(sku, _OP_PRICE, "set_price", price, _F64)
+
+    def set_discount_percent(self, sku: str, pct: float) -> None:
+        self._update(sku, _OP_DISCOUNT, "set_discount_percent", pct, _F64)
+
+    def _update(
+        self, sku: str, op: int, setter: str, value: object, codec: struct.Struct
+    ) -> None:
+        _check_storable(setter, value)
+        try:
+            payload = codec.pack(value)
+        except struct.error as exc:
+            raise TypeError(f"{setter} value cannot be journaled: {exc}") from exc
+        record = _encode(op, sku, payload)
+        with self._lock:
+            getattr(self.get(sku), setter)(value)
+            self._pending.append(record)
+        self._maybe_commit()
+
+    # -- Persistence functions --
+    def _maybe_commit(self) -> None:
+        if len(self._pending) >= self._group_commit_ops:
+            self.flush()
+            if self._wal_bytes >= self._compact_wal_bytes:
+                self.compact()
+
+    def flush(self) -> None:
+        """Write every buffered record and fsync them as one group."""
+        with self._io_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            data = b"".join(batch)
+            self._wal.write(data)
+            self._wal.flush()
+            if self._fsync:
+                os.fsync(self._wal.fileno())
+            with self._lock:
+                self._wal_bytes += len(data)
+
+    def compact(self) -> None:
+        """Write a fresh snapshot and start an empty WAL of the next generation."""
+        with self._io_lock:
+            with self._lock:
+                skus = list(self._catalog)
+                payload = dumps_bikes(self._catalog[s] for s in skus)
+                # Buffered records are already reflected in the snapshot.
+                self._pending = []
+            raw_skus = json.dumps(skus, separators=(",", ":")).encode("utf-8")
+            generation = self._generation + 1
+
+            tmp_path = self._snap_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_SNAP_HEAD.pack(_SNAP_MAGIC, generation, len(raw_skus)))
+                f.write(raw_skus)
+                f.write(payload)
+                f.flush()
+                if self._fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self._snap_path)
+            self._fsync_directory()
+
+            # From here the old WAL is stale: recovery skips it by generation.
+            self._new_wal(generation)
+            self._wal.close()
+            self._wal = open(self._wal_path, "ab")
+            self._generation = generation
+            with self._lock:
+                self._wal_bytes = 0
+
+    def _new_wal(self, generation: int) -> None:
+        """Atomically replace the WAL file with an empty one of `generation`."""
+        tmp_path = self._wal_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_WAL_HEAD.pack(_WAL_MAGIC, generation))
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self._wal_path)
+        self._fsync_directory()
+
+    def _fsync_directory(self) -> None:
+        """Make a rename in the store directory durable (POSIX only)."""
+        if not self._fsync or os.name != "posix":
+            return
+        fd = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        if self._wal.closed:
+            return
+        self.flush()
+        self._wal.close()
+
+    def __enter__(self) -> CatalogStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -19,9 +19,49 @@ Output:
 """
 
 from __future__ import annotations
-from typing import Dict, List
+import struct
 import sys
 
+# Annotations use builtin generics and collections.abc (not typing), so
+# typing.get_type_hints() resolves them without importing typing here.
+from collections.abc import Callable, Iterable, Sequence
+
+# Constructor defaults, built once. They are copied into each instance and
+# never mutated here.
+_DEFAULT_COLORS = ("black", "silver", "red")
+_DEFAULT_FEATURES = {"has_rack": True, "has_lights": True, "has_fenders": False}
+
+# Types each numeric constructor field accepts (subclasses such as bool too).
+_NUMBER_TYPES = (int, float)
+
+# Wire format shared by to_bytes()/dumps_bikes():
+#   header: magic "EB" | version u8 | n_strings u32 | n_shapes u32 | n_bikes u32
+#   strings: u32 byte length + utf-8 payload, each
+#   shapes: u16 n_colors | u16 n_features | n_colors x u32 | n_features x (u32, bool)
+#   bikes: fixed-width _RECORD rows
+# Strings are u32 indexes into the string table. A "shape" is a distinct
+# (available_colors, features) pair; bikes in a catalog share a handful of
+# them, so colors and feature flags are written once per shape, not per bike.
+_WIRE_MAGIC = b"EB"
+_WIRE_VERSION = 1
+_HEADER = struct.Struct("<2sBIII")
+_U32 = struct.Struct("<I")
+_SHAPE_HEAD = struct.Struct("<HH")
+# name, shape, price, stock, weight_kg, battery_wh, assist, discount, active,
+# position of selected_color within the shape's colors
+_RECORD = struct.Struct("<IIdIdIBd?H")
+
+# One compiled struct per (n_colors, n_features) shape layout seen so far.
+_shape_tail_cache: dict[tuple[int, int], struct.Struct] = {}
+# Real catalogs have a handful of shapes; the cap keeps shape counts taken
+# from untrusted payloads from growing the cache without bound.
+_SHAPE_TAIL_CACHE_MAX = 64
+
+# json (and the re module it pulls in) is imported by the first JSON call
+# rather than at module import; see _load_json().
+_json_module = None
+_JSON_ENCODER = None
+
 
 class ElectricBike:
     """
@@ -40,8 +80,15 @@ class ElectricBike:
       Mutually dependent attributes:
           - _stock (int) and _is_active (bool): stock == 0 forces is_active False.
           - _discount_percent (float) influences computed current price.
+
+      Price listeners (see add_price_listener) are called with the bike after
+      every successful set_price/set_discount_percent. They are not part of the
+      pickled/serialized state.
     """
 
+    # Empty class-level default: bikes without listeners carry no extra field.
+    _price_listeners: tuple[Callable[[ElectricBike], None], ...] = ()
+
     def __init__(
         self,
         name: str,
@@ -49,55 +96,56 @@ class ElectricBike:
         *,
         stock: int = 0,
         weight_kg: float = 22.5,
-        available_colors: List[str] | None = None,
+        available_colors: list[str] | None = None,
         selected_color: str | None = None,
-        features: Dict[str, bool] | None = None,
+        features: dict[str, bool] | None = None,
         battery_wh: int = 450,
         assist_level: int = 3,
         discount_percent: float = 0.0,
     ) -> None:
         # Basic validation
-        if not isinstance(name, str) or not name.strip():
+        numbers = _NUMBER_TYPES
+        if not isinstance(name, str):
+            raise TypeError("name must be a non-empty string")
+        name = name.strip()
+        if not name:
             raise TypeError("name must be a non-empty string")
-        if not isinstance(price, (int, float)) or price < 0:
+        if not isinstance(price, numbers) or price < 0:
             raise ValueError("price must be a non-negative number")
         if not isinstance(stock, int) or stock < 0:
             raise ValueError("stock must be a non-negative int")
-        if not isinstance(weight_kg, (int, float)) or weight_kg <= 0:
+        if not isinstance(weight_kg, numbers) or weight_kg <= 0:
             raise ValueError("weight_kg must be a positive number")
         if not isinstance(battery_wh, int) or battery_wh <= 0:
             raise ValueError("battery_wh must be a positive int")
         if not isinstance(assist_level, int) or not (1 <= assist_level <= 5):
             raise ValueError("assist_level must be an int in [1..5]")
-        if not isinstance(discount_percent, (int, float)) or not (
+        if not isinstance(discount_percent, numbers) or not (
             0.0 <= discount_percent < 1.0
         ):
             raise ValueError("discount_percent must be in [0.0, 1.0)")
 
-        self._name: str = name.strip()
+        colors: list[str] = list(available_colors or _DEFAULT_COLORS)
+        self._name: str = name
         self._price: float = float(price)
         self._stock: int = stock
         self._weight_kg: float = float(weight_kg)
-        self._available_colors: List[str] = list(
-            available_colors or ["black", "silver", "red"]
-        )
-        self._features: Dict[str, bool] = dict(
-            features or {"has_rack": True, "has_lights": True, "has_fenders": False}
-        )
+        self._available_colors: list[str] = colors
+        self._features: dict[str, bool] = dict(features or _DEFAULT_FEATURES)
         self._battery_wh: int = battery_wh
         self._assist_level: int = assist_level
         self._discount_percent: float = float(discount_percent)
 
         # selected_color defaults to first available if not provided
         if selected_color is None:
-            self._selected_color: str = self._available_colors[0]
-        else:
-            if selected_color not in self._available_colors:
-                raise ValueError("selected_color must exist in available_colors")
+            self._selected_color: str = colors[0]
+        elif selected_color in colors:
             self._selected_color = selected_color
+        else:
+            raise ValueError("selected_color must exist in available_colors")
 
         # Active is derived from the stock initially
-        self._is_active: bool = self._stock > 0
+        self._is_active: bool = stock > 0
 
     # -- Getter functions --
     def get_name(self) -> str:
@@ -121,10 +169,10 @@ class ElectricBike:
     def get_stock(self) -> int:
         return self._stock
 
-    def get_available_colors(self) -> List[str]:
+    def get_available_colors(self) -> list[str]:
         return self._available_colors
 
-    def get_features(self) -> Dict[str, bool]:
+    def get_features(self) -> dict[str, bool]:
         return self._features
 
     def get_selected_color(self) -> str:
@@ -151,6 +199,8 @@ class ElectricBike:
             raise (ValueError("Price cannot be negative."))
         else:
             self._price = price
+        for listener in self._price_listeners:
+            listener(self)
 
     def set_discount_percent(self, pct: float) -> None:
         if pct >= 1 or pct < 0:
@@ -160,6 +210,8 @@ class ElectricBike:
                 )
             )
         self._discount_percent = pct
+        for listener in self._price_listeners:
+            listener(self)
 
     def set_stock(self, qty: int) -> None:
         if qty < 0:
@@ -231,9 +283,84 @@ class ElectricBike:
         else:
             self._available_colors.remove(color)
 
+    def add_price_listener(self, listener: Callable[[ElectricBike], None]) -> None:
+        if not callable(listener):
+            raise TypeError("listener must be callable")
+        self._price_listeners = self._price_listeners + (listener,)
+
+    def remove_price_listener(self, listener: Callable[[ElectricBike], None]) -> None:
+        listeners = list(self._price_listeners)
+        if listener not in listeners:
+            raise ValueError("listener is not registered")
+        listeners.remove(listener)
+        self._price_listeners = tuple(listeners)
+
+    # -- Serialization functions --
+    def __getstate__(self) -> tuple[object, ...]:
+        """
+        Compact positional state; avoids pickling the attribute-name keys.
+
+        The colors list and features dict are returned as-is (not copied) to
+        keep pickling cheap; __setstate__ copies them. There is deliberately no
+        Python-level __reduce__: object.__reduce_ex__ (in C) consumes this
+        state directly, which is the fast path multiprocessing uses.
+        """
+        return (
+            self._name,
+            self._price,
+            self._stock,
+            self._weight_kg,
+            self._battery_wh,
+            self._assist_level,
+            self._discount_percent,
+            self._is_active,
+            self._selected_color,
+            self._available_colors,
+            self._features,
+        )
+
+    def __setstate__(self, state: tuple[object, ...]) -> None:
+        (
+            self._name,
+            self._price,
+            self._stock,
+            self._weight_kg,
+            self._battery_wh,
+            self._assist_level,
+            self._discount_percent,
+            self._is_active,
+            self._selected_color,
+            colors,
+            features,
+        ) = state
+        self._available_colors = list(colors)
+        self._features = dict(features)
+
+    def to_bytes(self) -> bytes:
+        """Binary encoding of this bike (same wire format as dumps_bikes)."""
+        return dumps_bikes((self,))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ElectricBike:
+        bikes = loads_bikes(data, cls)
+        if len(bikes) != 1:
+            raise ValueError("payload must contain exactly one bike")
+        return bikes[0]
+
+    def to_json(self) -> str:
+        """Compact JSON array: scalar fields, then colors, then features."""
+        return _json_encode(list(self.__getstate__()))
+
+    @classmethod
+    def from_json(cls, text: str) -> ElectricBike:
+        fields = _json_decode(text)
+        if not isinstance(fields, list) or len(fields) != 11:
+            raise ValueError("JSON payload is not an encoded ElectricBike")
+        return _rebuild_bike(cls, fields)
+
     # -- Status functions --
     def __sizeof__(self) -> int:
-        import sys
+        getsizeof = sys.getsizeof
 
         # start with the shallow size of the instance itself (avoid recursion)
         total = object.__sizeof__(self)
@@ -241,27 +368,297 @@ class ElectricBike:
         # include the attribute dict (shallow)
         d = getattr(self, "__dict__", None)
         if d is not None:
-            total += sys.getsizeof(d)
+            total += getsizeof(d)
 
         # scalars/strings
-        total += sys.getsizeof(self._name)
-        total += sys.getsizeof(self._price)
-        total += sys.getsizeof(self._stock)
-        total += sys.getsizeof(self._is_active)
-        total += sys.getsizeof(self._weight_kg)
-        total += sys.getsizeof(self._battery_wh)
-        total += sys.getsizeof(self._assist_level)
-        total += sys.getsizeof(self._discount_percent)
-        total += sys.getsizeof(self._selected_color)
+        total += (
+            getsizeof(self._name)
+            + getsizeof(self._price)
+            + getsizeof(self._stock)
+            + getsizeof(self._is_active)
+            + getsizeof(self._weight_kg)
+            + getsizeof(self._battery_wh)
+            + getsizeof(self._assist_level)
+            + getsizeof(self._discount_percent)
+            + getsizeof(self._selected_color)
+        )
 
         # list of colors: list shell + each string
-        total += sys.getsizeof(self._available_colors)
-        for c in self._available_colors:
-            total += sys.getsizeof(c)
+        colors = self._available_colors
+        total += getsizeof(colors) + sum(map(getsizeof, colors))
 
         # features dict: dict shell + each key and value
-        total += sys.getsizeof(self._features)
-        for k, v in self._features.items():
-            total += sys.getsizeof(k) + sys.getsizeof(v)
+        features = self._features
+        total += (
+            getsizeof(features)
+            + sum(map(getsizeof, features))
+            + sum(map(getsizeof, features.values()))
+        )
 
         return total
+
+
+def _load_json() -> None:
+    global _json_module, _JSON_ENCODER
+    import json
+
+    # Reused encoder: compact separators, no circular check (payloads are flat).
+    _JSON_ENCODER = json.JSONEncoder(
+        separators=(",", ":"), ensure_ascii=False, check_circular=False
+    )
+    _json_module = json
+
+
+def _json_encode(obj: object) -> str:
+    if _JSON_ENCODER is None:
+        _load_json()
+    return _JSON_ENCODER.encode(obj)
+
+
+def _json_decode(text: str) -> object:
+    if _json_module is None:
+        _load_json()
+    return _json_module.loads(text)
+
+
+def _bad(field: str) -> ValueError:
+    return ValueError(f"invalid ElectricBike payload: bad {field}")
+
+
+def _check_scalars(
+    name: object, price: object, stock: object, weight: object, wh: object,
+    assist: object, pct: object, active: object,
+) -> None:
+    numbers = (int, float)
+    if not isinstance(name, str) or not name.strip():
+        raise _bad("name")
+    if not isinstance(price, numbers) or not price >= 0:
+        raise _bad("price")
+    if not isinstance(stock, int) or stock < 0:
+        raise _bad("stock")
+    if not isinstance(weight, numbers) or not weight > 0:
+        raise _bad("weight_kg")
+    if not isinstance(wh, int) or wh <= 0:
+        raise _bad("battery_wh")
+    if not isinstance(assist, int) or not (1 <= assist <= 5):
+        raise _bad("assist_level")
+    if not isinstance(pct, numbers) or not (0.0 <= pct < 1.0):
+        raise _bad("discount_percent")
+    if not isinstance(active, bool):
+        raise _bad("is_active")
+
+
+def _check_shape(colors: object, features: object) -> None:
+    if (
+        not isinstance(colors, (tuple, list))
+        or not colors
+        or not all(isinstance(c, str) for c in colors)
+    ):
+        raise _bad("available_colors")
+    pairs = features.items() if isinstance(features, dict) else features
+    if not isinstance(pairs, (tuple, list, type({}.items()))):
+        raise _bad("features")
+    for pair in pairs:
+        if (
+            not isinstance(pair, (tuple, list))
+            or len(pair) != 2
+            or not isinstance(pair[0], str)
+            or not isinstance(pair[1], bool)
+        ):
+            raise _bad("features")
+
+
+def _check_state(state: Sequence[object]) -> None:
+    """
+    Reject decoded state that the constructor/setters could never produce.
+    Raises ValueError naming the first bad field.
+    """
+    if not isinstance(state, (tuple, list)) or len(state) != 11:
+        raise ValueError("invalid ElectricBike payload: wrong number of fields")
+    _check_scalars(*state[:8])
+    _check_shape(state[9], state[10])
+    if not isinstance(state[8], str) or state[8] not in state[9]:
+        raise _bad("selected_color")
+
+
+def _restore(cls: type, state: Sequence[object]) -> ElectricBike:
+    bike = cls.__new__(cls)
+    bike.__setstate__(state)
+    return bike
+
+
+def _rebuild_bike(cls: type, state: Sequence[object]) -> ElectricBike:
+    """Decode helper: validate state from a payload and restore a bike from it."""
+    _check_state(state)
+    return _restore(cls, state)
+
+
+def _shape_tail(n_colors: int, n_features: int) -> struct.Struct:
+    key = (n_colors, n_features)
+    tail = _shape_tail_cache.get(key)
+    if tail is None:
+        tail = struct.Struct(f"<{n_colors}I" + "I?" * n_features)
+        if len(_shape_tail_cache) < _SHAPE_TAIL_CACHE_MAX:
+            _shape_tail_cache[key] = tail
+    return tail
+
+
+class _StringTable:
+    """Assigns each distinct string a stable index in first-seen order."""
+
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+        self.strings: list[str] = []
+
+    def add(self, s: str) -> int:
+        i = self.index.get(s)
+        if i is None:
+            i = self.index[s] = len(self.strings)
+            self.strings.append(s)
+        return i
+
+
+def _flatten(bikes: Iterable[ElectricBike]) -> tuple[_StringTable, list, list]:
+    """Split bikes into (string table, distinct shapes, per-bike rows)."""
+    table = _StringTable()
+    add = table.add
+    shape_index: dict[tuple, int] = {}
+    shapes: list[tuple] = []
+    rows: list[tuple] = []
+    for bike in bikes:
+        (name, price, stock, weight, wh, assist, pct, active, selected,
+         colors, features) = bike.__getstate__()
+        colors = tuple(colors)
+        features = tuple(features.items())
+        key = (colors, features)
+        shape = shape_index.get(key)
+        if shape is None:
+            shape = shape_index[key] = len(shapes)
+            shapes.append(
+                ([add(c) for c in colors], [(add(k), v) for k, v in features])
+            )
+        rows.append(
+            (add(name), shape, price, stock, weight, wh, assist, pct, active,
+             colors.index(selected))
+        )
+    return table, shapes, rows
+
+
+def _inflate(
+    cls: type, strings: list[str], shapes: list, rows: Iterable[tuple]
+) -> list[ElectricBike]:
+    """Inverse of _flatten(): rebuild bikes from table indexes."""
+    resolved = [
+        (
+            [_at(strings, i) for i in colors],
+            [(_at(strings, k), v) for k, v in features],
+        )
+        for colors, features in shapes
+    ]
+    # shapes are shared, so validate each once rather than once per bike
+    for colors, features in resolved:
+        _check_shape(colors, features)
+    bikes: list[ElectricBike] = []
+    for (name, shape, price, stock, weight, wh, assist, pct, active,
+         selected) in rows:
+        colors, features = _at(resolved, shape)
+        name = _at(strings, name)
+        _check_scalars(name, price, stock, weight, wh, assist, pct, active)
+        bikes.append(
+            _restore(
+                cls,
+                (name, price, stock, weight, wh, assist, pct, active,
+                 _at(colors, selected), colors, features),
+            )
+        )
+    return bikes
+
+
+def _at(table: Sequence[object], index: object) -> object:
+    """Table lookup that rejects negative, bool or non-int indexes."""
+    if type(index) is not int or not (0 <= index < len(table)):
+        raise ValueError(f"table index out of range: {index!r}")
+    return table[index]
+
+
+def dumps_bikes(bikes: Iterable[ElectricBike]) -> bytes:
+    """Encode many bikes into one binary payload with shared string/shape tables."""
+    table, shapes, rows = _flatten(bikes)
+    parts: list[bytes] = [
+        _HEADER.pack(
+            _WIRE_MAGIC, _WIRE_VERSION, len(table.strings), len(shapes), len(rows)
+        )
+    ]
+    for s in table.strings:
+        raw = s.encode("utf-8")
+        parts.append(_U32.pack(len(raw)))
+        parts.append(raw)
+    for colors, features in shapes:
+        parts.append(_SHAPE_HEAD.pack(len(colors), len(features)))
+        flat: list[object] = list(colors)
+        for key, enabled in features:
+            flat.append(key)
+            flat.append(enabled)
+        parts.append(_shape_tail(len(colors), len(features)).pack(*flat))
+    pack = _RECORD.pack
+    try:
+        parts.extend([pack(*row) for row in rows])
+    except struct.error as exc:
+        raise ValueError(f"bike field out of wire-format range: {exc}") from exc
+    return b"".join(parts)
+
+
+def loads_bikes(data: bytes, cls: type = ElectricBike) -> list[ElectricBike]:
+    """Decode a payload produced by dumps_bikes()/to_bytes()."""
+    try:
+        magic, version, n_strings, n_shapes, n_bikes = _HEADER.unpack_from(data, 0)
+        if magic != _WIRE_MAGIC or version != _WIRE_VERSION:
+            raise ValueError("unrecognized ElectricBike payload")
+        offset = _HEADER.size
+        view = memoryview(data)
+        strings: list[str] = []
+        for _ in range(n_strings):
+            (length,) = _U32.unpack_from(data, offset)
+            offset += _U32.size
+            strings.append(str(view[offset : offset + length], "utf-8"))
+            offset += length
+
+        shapes: list[tuple] = []
+        for _ in range(n_shapes):
+            n_colors, n_features = _SHAPE_HEAD.unpack_from(data, offset)
+            offset += _SHAPE_HEAD.size
+            # size check first: the counts are untrusted, and a Struct for
+            # them would be allocated (and cached) before unpack_from fails
+            if offset + 4 * n_colors + 5 * n_features > len(data):
+                raise ValueError("truncated or corrupt ElectricBike payload")
+            tail = _shape_tail(n_colors, n_features)
+            flat = tail.unpack_from(data, offset)
+            offset += tail.size
+            pairs = flat[n_colors:]
+            shapes.append((flat[:n_colors], list(zip(pairs[::2], pairs[1::2]))))
+
+        end = offset + n_bikes * _RECORD.size
+        if end != len(data):
+            raise ValueError("truncated or corrupt ElectricBike payload")
+        rows = _RECORD.iter_unpack(view[offset:end])
+        return _inflate(cls, strings, shapes, rows)
+    except (struct.error, IndexError, UnicodeDecodeError) as exc:
+        raise ValueError("truncated or corrupt ElectricBike payload") from exc
+
+
+def dumps_bikes_json(bikes: Iterable[ElectricBike]) -> str:
+    """JSON counterpart of dumps_bikes(), using the same string/shape tables."""
+    table, shapes, rows = _flatten(bikes)
+    return _json_encode(
+        {"v": _WIRE_VERSION, "strings": table.strings, "shapes": shapes, "bikes": rows}
+    )
+
+
+def loads_bikes_json(text: str, cls: type = ElectricBike) -> list[ElectricBike]:
+    payload = _json_decode(text)
+    if not isinstance(payload, dict) or payload.get("v") != _WIRE_VERSION:
+        raise ValueError("unrecognized ElectricBike JSON payload")
+    try:
+        return _inflate(cls, payload["strings"], payload["shapes"], payload["bikes"])
+    except (AttributeError, KeyError, IndexError, TypeError, ValueError) as exc:
+        raise ValueError(f"corrupt ElectricBike JSON payload: {exc}") from exc
@@ -0,0 +1,234 @@
+"""
+PricingEngine: precomputed per-region storefront prices for ElectricBikes.
+
+Description:
+  A Region has a currency conversion rate, a sales-tax rate and an ordered
+  list of stacked Promotions. For every (sku, region) pair the engine keeps
+  the final shelf price in a table, so get_price() is a pair of dict lookups.
+
+    local  = bike.get_current_price() * fx_rate
+    local  = promotion_n(... promotion_1(local))    # in list order
+    final  = round(max(local, 0.0) * (1 + tax_rate), 2)
+
+  Rows are kept current incrementally:
+    - each registered bike gets a price listener, so set_price() or
+      set_discount_percent() on it (directly or through CatalogStore)
+      recomputes that SKU's row only, one entry per region;
+    - set_region() recomputes that region's column only.
+
+  Listeners hold the engine weakly, so bikes never keep a dropped engine
+  alive; its listeners unregister themselves on the next price change. Call
+  close() (or use the engine as a context manager) to detach them at once.
+
+Output:
+  Raises ValueError for unknown SKUs/regions and out-of-range rates,
+  TypeError for wrong argument types.
+"""
+
+from __future__ import annotations
+from types import MappingProxyType
+import weakref
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+from mse240_a1.src.electric_bike import ElectricBike
+
+
+class Promotion:
+    """
+    A stackable price rule: percent off, then a fixed amount off (in the
+    region's currency). Applies to every SKU unless `skus` is given.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        percent_off: float = 0.0,
+        amount_off: float = 0.0,
+        skus: Iterable[str] | None = None,
+    ) -> None:
+        if not isinstance(name, str) or not name.strip():
+            raise TypeError("name must be a non-empty string")
+        if not isinstance(percent_off, (int, float)) or not (0.0 <= percent_off < 1.0):
+            raise ValueError("percent_off must be in [0.0, 1.0)")
+        if not isinstance(amount_off, (int, float)) or amount_off < 0:
+            raise ValueError("amount_off must be a non-negative number")
+        if isinstance(skus, str):
+            # frozenset("AB") would silently mean SKUs "A" and "B"
+            raise TypeError("skus must be an iterable of SKU strings, not a str")
+
+        self._name: str = name.strip()
+        self._multiplier: float = 1.0 - float(percent_off)
+        self._amount_off: float = float(amount_off)
+        self._skus: FrozenSet[str] | None = None if skus is None else frozenset(skus)
+
+    def get_name(self) -> str:
+        return self._name
+
+    def applies_to(self, sku: str) -> bool:
+        return self._skus is None or sku in self._skus
+
+    def apply(self, price: float) -> float:
+        return price * self._multiplier - self._amount_off
+
+
+class Region:
+    """Currency, tax and promotions for one storefront region."""
+
+    def __init__(
+        self,
+        code: str,
+        currency: str,
+        *,
+        fx_rate: float = 1.0,
+        tax_rate: float = 0.0,
+        promotions: Iterable[Promotion] = (),
+    ) -> None:
+        if not isinstance(code, str) or not code.strip():
+            raise TypeError("code must be a non-empty string")
+        if not isinstance(currency, str) or not currency.strip():
+            raise TypeError("currency must be a non-empty string")
+        if not isinstance(fx_rate, (int, float)) or fx_rate <= 0:
+            raise ValueError("fx_rate must be a positive number")
+        if not isinstance(tax_rate, (int, float)) or tax_rate < 0:
+            raise ValueError("tax_rate must be a non-negative number")
+        promotions = tuple(promotions)
+        for promo in promotions:
+            if not isinstance(promo, Promotion):
+                raise TypeError("promotions must be Promotion instances")
+
+        self._code: str = code.strip()
+        self._currency: str = currency.strip()
+        self._fx_rate: float = float(fx_rate)
+        self._tax_multiplier: float = 1.0 + float(tax_rate)
+        self._promotions: Tuple[Promotion, ...] = promotions
+
+    def get_code(self) -> str:
+        return self._code
+
+    def get_currency(self) -> str:
+        return self._currency
+
+    def get_promotions(self) -> Tuple[Promotion, ...]:
+        return self._promotions
+
+    def price_for(self, sku: str, base_price: float) -> float:
+        """Final shelf price in this region for a bike's current base price."""
+        local = base_price * self._fx_rate
+        for promo in self._promotions:
+            if promo.applies_to(sku):
+                local = promo.apply(local)
+        return round(max(local, 0.0) * self._tax_multiplier, 2)
+
+
+class PricingEngine:
+    """Per-region price tables over a set of SKU-registered bikes."""
+
+    def __init__(self, regions: Iterable[Region] = ()) -> None:
+        self._regions: Dict[str, Region] = {}
+        self._bikes: Dict[str, ElectricBike] = {}
+        self._listeners: Dict[str, Callable[[ElectricBike], None]] = {}
+        # region code -> sku -> final price
+        self._tables: Dict[str, Dict[str, float]] = {}
+        self._rows_recomputed = 0
+        for region in regions:
+            self.set_region(region)
+
+    # -- Getter functions --
+    def get_price(self, sku: str, region_code: str) -> float:
+        try:
+            return self._tables[region_code][sku]
+        except KeyError:
+            if region_code not in self._tables:
+                raise ValueError(f"unknown region: {region_code!r}") from None
+            raise ValueError(f"unknown sku: {sku!r}") from None
+
+    def get_region_prices(self, region_code: str) -> Mapping[str, float]:
+        """Read-only live view of one region's {sku: price} table."""
+        try:
+            return MappingProxyType(self._tables[region_code])
+        except KeyError:
+            raise ValueError(f"unknown region: {region_code!r}") from None
+
+    def get_region_codes(self) -> List[str]:
+        return list(self._regions)
+
+    def get_rows_recomputed(self) -> int:
+        """Number of (sku, region) prices computed so far (for diagnostics)."""
+        return self._rows_recomputed
+
+    def __contains__(self, sku: object) -> bool:
+        return sku in self._bikes
+
+    def __len__(self) -> int:
+        return len(self._bikes)
+
+    # -- Setter functions --
+    def set_region(self, region: Region) -> None:
+        """Add or replace a region and (re)compute only its column."""
+        if not isinstance(region, Region):
+            raise TypeError("region must be a Region")
+        code = region.get_code()
+        self._regions[code] = region
+        price_for = region.price_for
+        self._tables[code] = {
+            sku: price_for(sku, bike.get_current_price())
+            for sku, bike in self._bikes.items()
+        }
+        self._rows_recomputed += len(self._bikes)
+
+    def remove_region(self, region_code: str) -> None:
+        if region_code not in self._regions:
+            raise ValueError(f"unknown region: {region_code!r}")
+        del self._regions[region_code]
+        del self._tables[region_code]
+
+    def add_bike(self, sku: str, bike: ElectricBike) -> None:
+        """Register `bike` under `sku`, compute its row and track its price."""
+        if not isinstance(sku, str) or not sku:
+            raise TypeError("sku must be a non-empty string")
+        if not isinstance(bike, ElectricBike):
+            raise TypeError("bike must be an ElectricBike")
+        if sku in self._bikes:
+            self.remove_bike(sku)
+
+        engine_ref = weakref.ref(self)
+
+        def listener(changed: ElectricBike, sku: str = sku) -> None:
+            engine = engine_ref()
+            if engine is None:
+                changed.remove_price_listener(listener)
+            else:
+                engine._recompute_row(sku)
+
+        bike.add_price_listener(listener)
+        self._bikes[sku] = bike
+        self._listeners[sku] = listener
+        self._recompute_row(sku)
+
+    def remove_bike(self, sku: str) -> None:
+        try:
+            bike = self._bikes.pop(sku)
+        except KeyError:
+            raise ValueError(f"unknown sku: {sku!r}") from None
+        bike.remove_price_listener(self._listeners.pop(sku))
+        for table in self._tables.values():
+            del table[sku]
+
+    def close(self) -> None:
+        """Unregister every bike, detaching the engine's price listeners."""
+        for sku in list(self._bikes):
+            self.remove_bike(sku)
+
+    def __enter__(self) -> PricingEngine:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _recompute_row(self, sku: str) -> None:
+        base = self._bikes[sku].get_current_price()
+        tables = self._tables
+        for code, region in self._regions.items():
+            tables[code][sku] = region.price_for(sku, base)
+        self._rows_recomputed += len(self._regions)
@@ -0,0 +1,258 @@
+import sys
+import threading
+import time
+import unittest
+from mse240_a1.src.bike_cache import BikeCache, InMemoryBikeLoader
+from mse240_a1.src.electric_bike import ElectricBike
+
+
+def _catalog(n: int) -> dict:
+    return {f"EB-{i}": ElectricBike(f"Bike {i}", 100.0 + i, stock=i) for i in range(n)}
+
+
+class TestBikeCache(unittest.TestCase):
+    """Unit tests for BikeCache"""
+
+    def test_get_reads_through_then_hits(self):
+        """
+        Unit: BikeCache.get
+        Category: typical
+        Input: get("EB-1") twice
+        Output: same bike both times; one loader call; 1 miss, 1 hit
+        """
+        catalog = _catalog(3)
+        loader = InMemoryBikeLoader(catalog)
+        cache = BikeCache(loader)
+        self.assertIs(cache.get("EB-1"), catalog["EB-1"])
+        self.assertIs(cache.get("EB-1"), catalog["EB-1"])
+        self.assertEqual(loader.calls, [("EB-1",)])
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["loads"]), (1, 1, 1))
+
+    def test_get_unknown_sku(self):
+        """
+        Unit: BikeCache.get / get_many
+        Category: error
+        Input: get("nope"); get_many(["EB-0", "nope"])
+        Output: ValueError for get; get_many omits the unknown SKU
+        """
+        cache = BikeCache(InMemoryBikeLoader(_catalog(1)))
+        with self.assertRaises(ValueError):
+            cache.get("nope")
+        self.assertEqual(list(cache.get_many(["EB-0", "nope"])), ["EB-0"])
+        self.assertNotIn("nope", cache)
+
+    def test_get_many_batches_misses(self):
+        """
+        Unit: BikeCache.get_many
+        Category: batching
+        Input: 10 SKUs (2 already cached, 1 duplicated), max_batch=4
+        Output: only the 8 misses are loaded, in 2 loader calls of <= 4 SKUs
+        """
+        loader = InMemoryBikeLoader(_catalog(10))
+        cache = BikeCache(loader, max_batch=4)
+        cache.get_many(["EB-0", "EB-1"])
+        loader.calls.clear()
+        skus = [f"EB-{i}" for i in range(10)] + ["EB-5"]
+        result = cache.get_many(skus)
+        self.assertEqual(sorted(result), sorted(set(skus)))
+        self.assertEqual([len(c) for c in loader.calls], [4, 4])
+        self.assertNotIn("EB-0", [s for c in loader.calls for s in c])
+
+    def test_lru_eviction_by_entries(self):
+        """
+        Unit: BikeCache eviction
+        Category: LRU
+        Input: max_entries=2; load EB-0, EB-1; touch EB-0; load EB-2
+        Output: EB-1 (least recently used) evicted; EB-0 and EB-2 kept
+        """
+        cache = BikeCache(InMemoryBikeLoader(_catalog(3)), max_entries=2)
+        cache.get("EB-0")
+        cache.get("EB-1")
+        cache.get("EB-0")
+        cache.get("EB-2")
+        self.assertIn("EB-0", cache)
+        self.assertNotIn("EB-1", cache)
+        self.assertIn("EB-2", cache)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_eviction_by_bytes(self):
+        """
+        Unit: BikeCache eviction
+        Category: byte budget
+        Input: max_bytes fits about 3 bikes (by sys.getsizeof); load 10
+        Output: cached bytes stay within budget and equal the sum of entry sizes
+        """
+        catalog = _catalog(10)
+        one = sys.getsizeof(catalog["EB-0"])
+        cache = BikeCache(
+            InMemoryBikeLoader(catalog), max_entries=None, max_bytes=3 * one + one // 2
+        )
+        for sku in catalog:
+            cache.get(sku)
+        self.assertLessEqual(cache.get_bytes(), 3 * one + one // 2)
+        self.assertGreaterEqual(len(cache), 2)
+        self.assertIn("EB-9", cache)
+        cache.invalidate("EB-9")
+        self.assertNotIn("EB-9", cache)
+        cached = [s for s in catalog if s in cache]
+        self.assertEqual(cache.get_bytes(), sum(sys.getsizeof(catalog[s]) for s in cached))
+
+    def test_concurrent_misses_load_once(self):
+        """
+        Unit: BikeCache.get
+        Category: concurrency/stampede
+        Input: 16 threads miss on the same SKU while the loader is slow
+        Output: exactly one loader call; every thread gets the same bike
+        """
+        catalog = _catalog(1)
+        started = threading.Event()
+
+        def slow(skus):
+            started.set()
+            time.sleep(0.05)
+
+        loader = InMemoryBikeLoader(catalog, on_load=slow)
+        cache = BikeCache(loader)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("EB-0")))
+            for _ in range(16)
+        ]
+        threads[0].start()
+        started.wait()
+        for t in threads[1:]:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(loader.calls), 1)
+        self.assertEqual(len(results), 16)
+        self.assertTrue(all(b is catalog["EB-0"] for b in results))
+
+    def test_loader_error_reaches_waiters_and_is_not_cached(self):
+        """
+        Unit: BikeCache.get
+        Category: error/concurrency
+        Input: loader raises RuntimeError once while another thread waits
+        Output: both callers see RuntimeError; next get() retries and succeeds
+        """
+        catalog = _catalog(1)
+        started = threading.Event()
+        release = threading.Event()
+        failures = []
+
+        def flaky(skus):
+            if not failures:
+                failures.append(skus)
+                started.set()
+                release.wait()
+                raise RuntimeError("backend down")
+
+        cache = BikeCache(InMemoryBikeLoader(catalog, on_load=flaky))
+        errors = []
+
+        def worker():
+            try:
+                cache.get("EB-0")
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        first = threading.Thread(target=worker)
+        first.start()
+        started.wait()
+        second = threading.Thread(target=worker)
+        second.start()
+        while cache.get_stats()["misses"] < 2:
+            time.sleep(0.001)
+        release.set()
+        first.join()
+        second.join()
+        self.assertEqual(len(errors), 2)
+        self.assertNotIn("EB-0", cache)
+        self.assertIs(cache.get("EB-0"), catalog["EB-0"])
+
+    def test_misbehaving_loader_releases_every_sku(self):
+        """
+        Unit: BikeCache.get_many
+        Category: error
+        Input: loader returns a list instead of a mapping; a non-ElectricBike
+               value; a bike whose size cannot be measured next to a good one
+        Output: the error propagates; nothing from the batch is cached; no
+                SKU left in flight, so a later get() fails fast instead of
+                waiting forever
+        """
+        cache = BikeCache(lambda skus: list(skus))
+        with self.assertRaises(TypeError):
+            cache.get_many(["a", "b"])
+        self.assertEqual(cache._inflight, {})
+        with self.assertRaises(TypeError):
+            cache.get("b")
+        self.assertEqual(len(cache), 0)
+
+        class Unsizable(ElectricBike):
+            def __sizeof__(self):
+                raise RuntimeError("no size")
+
+        bike = ElectricBike("Bike", 100.0)
+        for bad, error in ((object(), TypeError), (Unsizable("U", 1.0), RuntimeError)):
+            with self.subTest(bad=type(bad).__name__):
+                cache = BikeCache(lambda skus: {"a": bike, "b": bad})
+                with self.assertRaises(error):
+                    cache.get_many(["a", "b"])
+                self.assertEqual(cache._inflight, {})
+                self.assertEqual(len(cache), 0)
+                self.assertEqual(cache.get_bytes(), 0)
+                with self.assertRaises(error):
+                    cache.get("b")
+
+    def test_invalidate_during_load_is_not_cached(self):
+        """
+        Unit: BikeCache.invalidate
+        Category: concurrency
+        Input: invalidate("EB-0") while a load of EB-0 is in flight
+        Output: the loading caller still gets its bike, but it is not cached;
+                the next get() reloads
+        """
+        catalog = _catalog(1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def block_first(skus):
+            if not started.is_set():
+                started.set()
+                release.wait()
+
+        loader = InMemoryBikeLoader(catalog, on_load=block_first)
+        cache = BikeCache(loader)
+        results = []
+        worker = threading.Thread(target=lambda: results.append(cache.get("EB-0")))
+        worker.start()
+        started.wait()
+        cache.invalidate("EB-0")
+        release.set()
+        worker.join()
+        self.assertIs(results[0], catalog["EB-0"])
+        self.assertNotIn("EB-0", cache)
+        cache.get("EB-0")
+        self.assertEqual(cache.get_stats()["loads"], 2)
+        self.assertIn("EB-0", cache)
+
+    def test_constructor_rejects_bad_options(self):
+        """
+        Unit: BikeCache.__init__
+        Category: error
+        Input: non-callable loader; no bounds; non-positive bounds/batch
+        Output: TypeError for the loader; ValueError otherwise
+        """
+        loader = InMemoryBikeLoader({})
+        with self.assertRaises(TypeError):
+            BikeCache({})
+        for kwargs in (
+            {"max_entries": None},
+            {"max_entries": 0},
+            {"max_bytes": 0},
+            {"max_batch": 0},
+        ):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    BikeCache(loader, **kwargs)
@@ -0,0 +1,256 @@
+import os
+import struct
+import tempfile
+import unittest
+from mse240_a1.src.catalog_store import SNAPSHOT_NAME, WAL_NAME, CatalogStore, _encode
+from mse240_a1.src.electric_bike import ElectricBike
+
+
+class TestCatalogStore(unittest.TestCase):
+    """Unit tests for CatalogStore"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = self._tmp.name
+
+    def _open(self, **kwargs) -> CatalogStore:
+        store = CatalogStore(self.dir, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_recover_after_close(self):
+        """
+        Unit: CatalogStore.put / set_stock / set_price / set_discount_percent
+        Category: typical
+        Input: put two bikes, update them, close, reopen
+        Output: reopened catalog has the same state
+        """
+        with CatalogStore(self.dir) as store:
+            store.put("EB-1", ElectricBike("Bike 1", 1000.0, stock=3))
+            store.put("EB-2", ElectricBike("Bike 2", 1500.0, stock=1))
+            store.set_stock("EB-1", 0)
+            store.set_price("EB-2", 1399.99)
+            store.set_discount_percent("EB-2", 0.25)
+
+        store = self._open()
+        self.assertEqual(sorted(store.skus()), ["EB-1", "EB-2"])
+        self.assertEqual(store.get("EB-1").get_stock(), 0)
+        self.assertFalse(store.get("EB-1").is_active())
+        self.assertEqual(store.get("EB-2").get_price(), 1399.99)
+        self.assertAlmostEqual(store.get("EB-2").get_current_price(), 1049.99, places=2)
+
+    def test_group_commit_buffers_until_threshold(self):
+        """
+        Unit: CatalogStore group commit
+        Category: state
+        Input: group_commit_ops=4; 3 updates, then a 4th
+        Output: WAL file untouched until the 4th update, then all 4 written
+        """
+        store = self._open(group_commit_ops=4, fsync=False)
+        wal = os.path.join(self.dir, WAL_NAME)
+        header = os.path.getsize(wal)
+        store.put("EB-1", ElectricBike("Bike", 100.0, stock=1))
+        store.set_stock("EB-1", 2)
+        store.set_stock("EB-1", 3)
+        self.assertEqual(os.path.getsize(wal), header)
+        store.set_stock("EB-1", 4)
+        self.assertEqual(os.path.getsize(wal), header + store.get_wal_bytes())
+        self.assertGreater(store.get_wal_bytes(), 0)
+
+    def test_unflushed_updates_lost_flushed_kept(self):
+        """
+        Unit: CatalogStore.flush
+        Category: durability
+        Input: flush after set_stock(5); then set_stock(9) without flush; reopen
+        Output: recovered stock is 5
+        """
+        store = CatalogStore(self.dir, group_commit_ops=100)
+        store.put("EB-1", ElectricBike("Bike", 100.0, stock=1))
+        store.set_stock("EB-1", 5)
+        store.flush()
+        store.set_stock("EB-1", 9)
+        # simulate a crash: drop the buffer without flushing
+        store._pending.clear()
+        store._wal.close()
+
+        recovered = self._open()
+        self.assertEqual(recovered.get("EB-1").get_stock(), 5)
+
+    def test_torn_wal_tail_is_discarded(self):
+        """
+        Unit: CatalogStore WAL recovery
+        Category: error/recovery
+        Input: valid records followed by a partial record
+        Output: valid records replayed; WAL truncated to the last good record
+        """
+        with CatalogStore(self.dir) as store:
+            store.put("EB-1", ElectricBike("Bike", 100.0, stock=1))
+            store.set_stock("EB-1", 7)
+        good = os.path.getsize(os.path.join(self.dir, WAL_NAME))
+        with open(os.path.join(self.dir, WAL_NAME), "ab") as f:
+            f.write(b"\x20\x00\x00\x00garbage")
+
+        store = self._open()
+        self.assertEqual(store.get("EB-1").get_stock(), 7)
+        self.assertEqual(os.path.getsize(os.path.join(self.dir, WAL_NAME)), good)
+
+    def test_compact_writes_snapshot_and_truncates_wal(self):
+        """
+        Unit: CatalogStore.compact
+        Category: typical
+        Input: 50 bikes with updates; compact(); one more update; reopen
+        Output: WAL holds only the post-compaction record; state recovered
+        """
+        with CatalogStore(self.dir) as store:
+            for i in range(50):
+                store.put(f"EB-{i}", ElectricBike(f"Bike {i}", 100.0 + i, stock=i))
+                store.set_discount_percent(f"EB-{i}", 0.1)
+            store.remove("EB-0")
+            store.compact()
+            self.assertEqual(store.get_wal_bytes(), 0)
+            self.assertTrue(os.path.exists(os.path.join(self.dir, SNAPSHOT_NAME)))
+            store.set_stock("EB-49", 0)
+
+        store = self._open()
+        self.assertEqual(len(store), 49)
+        self.assertNotIn("EB-0", store)
+        self.assertEqual(store.get("EB-49").get_stock(), 0)
+        self.assertAlmostEqual(store.get("EB-10").get_current_price(), 99.0, places=2)
+
+    def test_crash_between_snapshot_and_wal_rotation(self):
+        """
+        Unit: CatalogStore.compact / WAL recovery
+        Category: durability
+        Input: WAL holds set_stock(A, 5) and set_stock(B, 3); remove(B) and
+               set_stock(A, 7) buffered; compact() crashes right after the
+               snapshot is replaced; reopen
+        Output: stale WAL ignored: A has stock 7, B stays removed
+        """
+        store = CatalogStore(self.dir, group_commit_ops=100)
+        store.put("A", ElectricBike("Bike A", 100.0, stock=1))
+        store.put("B", ElectricBike("Bike B", 200.0, stock=1))
+        store.compact()
+        store.set_stock("A", 5)
+        store.set_stock("B", 3)
+        store.flush()
+        store.remove("B")
+        store.set_stock("A", 7)
+
+        def crash(generation):
+            raise OSError("simulated crash")
+
+        store._new_wal = crash
+        with self.assertRaises(OSError):
+            store.compact()
+        store._wal.close()
+
+        recovered = self._open()
+        self.assertEqual(recovered.skus(), ["A"])
+        self.assertEqual(recovered.get("A").get_stock(), 7)
+        self.assertEqual(recovered.get_wal_bytes(), 0)
+        recovered.set_stock("A", 8)
+        recovered.close()
+        self.assertEqual(self._open().get("A").get_stock(), 8)
+
+    def test_wal_record_for_unknown_sku(self):
+        """
+        Unit: CatalogStore WAL recovery
+        Category: error
+        Input: a valid WAL record updating a SKU that is not in the catalog
+        Output: opening the store raises ValueError
+        """
+        with CatalogStore(self.dir) as store:
+            store.put("EB-1", ElectricBike("Bike", 100.0, stock=1))
+        with open(os.path.join(self.dir, WAL_NAME), "ab") as f:
+            f.write(_encode(3, "EB-9", struct.pack("<q", 1)))
+        with self.assertRaises(ValueError):
+            CatalogStore(self.dir)
+
+    def test_auto_compaction(self):
+        """
+        Unit: CatalogStore automatic compaction
+        Category: state
+        Input: compact_wal_bytes=1, group_commit_ops=2, several updates
+        Output: snapshot exists and the WAL is empty after the last group
+        """
+        store = self._open(group_commit_ops=2, compact_wal_bytes=1, fsync=False)
+        store.put("EB-1", ElectricBike("Bike", 100.0, stock=1))
+        for qty in range(9):
+            store.set_stock("EB-1", qty)
+        self.assertTrue(os.path.exists(os.path.join(self.dir, SNAPSHOT_NAME)))
+        self.assertEqual(store.get_wal_bytes(), 0)
+
+    def test_invalid_updates_not_journaled(self):
+        """
+        Unit: CatalogStore setters
+        Category: error
+        Input: unknown sku, negative stock, bad discount, non-int stock, bad put args
+        Output: ValueError/TypeError; nothing buffered; bike unchanged
+        """
+        store = self._open()
+        store.put("EB-1", ElectricBike("Bike", 100.0, stock=1))
+        store.flush()
+        before = store.get_wal_bytes()
+        with self.assertRaises(ValueError):
+            store.set_stock("nope", 1)
+        with self.assertRaises(ValueError):
+            store.set_stock("EB-1", -1)
+        with self.assertRaises(ValueError):
+            store.set_discount_percent("EB-1", 1.0)
+        with self.assertRaises(TypeError):
+            store.set_stock("EB-1", "3")
+        with self.assertRaises(ValueError):
+            store.remove("nope")
+        with self.assertRaises(TypeError):
+            store.put("", ElectricBike("Bike", 1.0))
+        with self.assertRaises(TypeError):
+            store.put("EB-2", object())
+        self.assertEqual(store.get_wal_bytes(), before)
+        self.assertEqual(store.get("EB-1").get_stock(), 1)
+
+    def test_unstorable_values_rejected_before_logging(self):
+        """
+        Unit: CatalogStore setters / put
+        Category: error/recovery
+        Input: NaN/inf price and discount, stock 2**33, a bike with a NaN price
+        Output: ValueError; bike unchanged; nothing logged; compact() and
+                reopen still work
+        """
+        store = self._open()
+        store.put("A", ElectricBike("Bike", 100.0, stock=1))
+        store.flush()
+        before = store.get_wal_bytes()
+        cases = (
+            (store.set_discount_percent, float("nan")),
+            (store.set_price, float("nan")),
+            (store.set_price, float("inf")),
+            (store.set_stock, 2**33),
+        )
+        for setter, value in cases:
+            with self.subTest(setter=setter.__name__, value=value):
+                with self.assertRaises(ValueError):
+                    setter("A", value)
+        with self.assertRaises(ValueError):
+            store.put("B", ElectricBike("Bike", float("nan")))
+        self.assertEqual(store.get_wal_bytes(), before)
+        self.assertNotIn("B", store)
+        self.assertEqual(store.get("A").get_price(), 100.0)
+        self.assertEqual(store.get("A").get_stock(), 1)
+
+        store.set_stock("A", 2**32 - 1)
+        store.compact()
+        store.close()
+        self.assertEqual(self._open().get("A").get_stock(), 2**32 - 1)
+
+    def test_constructor_rejects_bad_options(self):
+        """
+        Unit: CatalogStore.__init__
+        Category: error
+        Input: group_commit_ops=0, compact_wal_bytes=0
+        Output: raises ValueError
+        """
+        with self.assertRaises(ValueError):
+            CatalogStore(self.dir, group_commit_ops=0)
+        with self.assertRaises(ValueError):
+            CatalogStore(self.dir, compact_wal_bytes=0)
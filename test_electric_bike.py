@@ -1,7 +1,17 @@
 import sys
 import gc
+import pickle
+import struct
+import typing
+from json import dumps as dumps_json
 import unittest
-from mse240_a1.src.electric_bike import ElectricBike
+from mse240_a1.src.electric_bike import (
+    ElectricBike,
+    dumps_bikes,
+    dumps_bikes_json,
+    loads_bikes,
+    loads_bikes_json,
+)
 
 
 def _gc_header_bytes() -> int:
@@ -64,6 +74,51 @@ class TestElectricBike(unittest.TestCase):
         eb.set_price(0.0)
         self.assertEqual(eb.get_price(), 0.0)
 
+    def test_default_colors_and_features_not_shared(self):
+        """
+        Unit: ElectricBike.__init__
+        Category: state
+        Input: two bikes built with default colors/features; mutate the first
+        Output: second bike still has the original defaults
+        """
+        eb1 = ElectricBike("Bike", 1000.0, stock=1)
+        eb2 = ElectricBike("Bike", 1000.0, stock=1)
+        eb1.add_color("pink")
+        eb1.set_feature("has_fenders", True)
+        self.assertEqual(eb2.get_available_colors(), ["black", "silver", "red"])
+        self.assertEqual(
+            eb2.get_features(),
+            {"has_rack": True, "has_lights": True, "has_fenders": False},
+        )
+        self.assertEqual(
+            ElectricBike("Bike", 1.0).get_available_colors(), ["black", "silver", "red"]
+        )
+
+    def test_constructor_type_checks(self):
+        """
+        Unit: ElectricBike.__init__
+        Category: type/error
+        Input: non-str/blank name, non-numeric price, float stock, bool price
+        Output: TypeError for name; ValueError for numeric fields; bool accepted
+        """
+        for bad in (None, 5, "   "):
+            with self.subTest(name=bad):
+                with self.assertRaises(TypeError):
+                    ElectricBike(bad, 1.0)
+        for kwargs in (
+            {"price": "5"},
+            {"price": 1.0, "stock": 1.5},
+            {"price": 1.0, "battery_wh": 450.0},
+            {"price": 1.0, "assist_level": 6},
+            {"price": 1.0, "weight_kg": 0},
+            {"price": 1.0, "discount_percent": 1.0},
+        ):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    ElectricBike("Bike", **kwargs)
+        self.assertEqual(ElectricBike("  Bike  ", True).get_name(), "Bike")
+        self.assertEqual(ElectricBike("Bike", True).get_price(), 1.0)
+
     def test_get_current_price_typical(self):
         """
         Unit: ElectricBike.get_current_price
@@ -522,3 +577,239 @@ class TestElectricBike(unittest.TestCase):
         deep_no_gc = eb.__sizeof__()
         maybe_gc = _gc_header_bytes() if gc.is_tracked(eb) else 0
         self.assertEqual(sys.getsizeof(eb), deep_no_gc + maybe_gc)
+
+    def test_price_listeners(self):
+        """
+        Unit: ElectricBike.add_price_listener / remove_price_listener
+        Category: typical/error
+        Input: listener on a bike; set_price, set_discount_percent, set_stock,
+               rejected set_price; then remove it
+        Output: called once per accepted price/discount change only; other
+                bikes unaffected; removing twice raises ValueError
+        """
+        calls = []
+        eb = ElectricBike("Bike", 1000.0, stock=1)
+        other = ElectricBike("Other", 1000.0, stock=1)
+        eb.add_price_listener(calls.append)
+        eb.set_price(900.0)
+        eb.set_discount_percent(0.1)
+        eb.set_stock(3)
+        other.set_price(1.0)
+        with self.assertRaises(ValueError):
+            eb.set_price(-1.0)
+        self.assertEqual(calls, [eb, eb])
+        eb.remove_price_listener(calls.append)
+        eb.set_price(800.0)
+        self.assertEqual(len(calls), 2)
+        with self.assertRaises(ValueError):
+            eb.remove_price_listener(calls.append)
+        with self.assertRaises(TypeError):
+            eb.add_price_listener("not callable")
+
+    def test_annotations_resolve(self):
+        """
+        Unit: ElectricBike annotations
+        Category: typing
+        Input: typing.get_type_hints on __init__, a getter and the listener API
+        Output: hints resolve to builtin generics, no NameError
+        """
+        hints = typing.get_type_hints(ElectricBike.__init__)
+        self.assertEqual(hints["available_colors"], list[str] | None)
+        self.assertEqual(hints["features"], dict[str, bool] | None)
+        self.assertEqual(typing.get_type_hints(ElectricBike.get_features)["return"], dict[str, bool])
+        typing.get_type_hints(ElectricBike.add_price_listener)
+        typing.get_type_hints(ElectricBike.__getstate__)
+
+    # -- Serialization function tests --
+
+    def _make_custom_bike(self) -> ElectricBike:
+        eb = ElectricBike(
+            "Vélo Cargo",
+            2499.5,
+            stock=4,
+            available_colors=["teal", "black"],
+            selected_color="black",
+            features={"has_rack": True, "has_lock": False},
+            battery_wh=625,
+            assist_level=5,
+            discount_percent=0.15,
+        )
+        eb.set_active(False)
+        return eb
+
+    def test_pickle_round_trip(self):
+        """
+        Unit: ElectricBike.__getstate__ / __setstate__ (pickle)
+        Category: typical
+        Input: bike with custom colors/features and is_active forced False
+        Output: unpickled bike has identical state and its own list/dict
+        """
+        eb = self._make_custom_bike()
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                copy = pickle.loads(pickle.dumps(eb, protocol=protocol))
+                self.assertIsInstance(copy, ElectricBike)
+                self.assertEqual(copy.__dict__, eb.__dict__)
+                self.assertIsNot(copy.get_available_colors(), eb.get_available_colors())
+                self.assertIsNot(copy.get_features(), eb.get_features())
+
+    def test_pickle_drops_price_listeners(self):
+        """
+        Unit: ElectricBike.__getstate__ (pickle)
+        Category: state
+        Input: bike with a price listener, pickled and restored
+        Output: restored bike has no listeners; original still notifies
+        """
+        calls = []
+        eb = ElectricBike("Bike", 1000.0, stock=1)
+        eb.add_price_listener(calls.append)
+        copy = pickle.loads(pickle.dumps(eb))
+        copy.set_price(1.0)
+        self.assertEqual(calls, [])
+        eb.set_price(2.0)
+        self.assertEqual(calls, [eb])
+
+    def test_to_bytes_round_trip(self):
+        """
+        Unit: ElectricBike.to_bytes / from_bytes
+        Category: typical
+        Input: bike with non-ASCII name and is_active forced False
+        Output: decoded bike has identical state
+        """
+        eb = self._make_custom_bike()
+        data = eb.to_bytes()
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(ElectricBike.from_bytes(data).__dict__, eb.__dict__)
+
+    def test_from_bytes_rejects_bad_payloads(self):
+        """
+        Unit: ElectricBike.from_bytes
+        Category: error
+        Input: truncated payload, wrong magic, two-bike payload
+        Output: raises ValueError
+        """
+        data = self._make_custom_bike().to_bytes()
+        for bad in (data[:-1], b"XX" + data[2:], b"", dumps_bikes([ElectricBike("A", 1.0)] * 2)):
+            with self.subTest(bad=bad[:8]):
+                with self.assertRaises(ValueError):
+                    ElectricBike.from_bytes(bad)
+
+    def test_to_bytes_rejects_out_of_range_field(self):
+        """
+        Unit: ElectricBike.to_bytes
+        Category: bounds
+        Input: stock above the u32 wire range
+        Output: raises ValueError
+        """
+        eb = ElectricBike("Bike", 1000.0, stock=2**32)
+        with self.assertRaises(ValueError):
+            eb.to_bytes()
+
+    def test_to_json_round_trip(self):
+        """
+        Unit: ElectricBike.to_json / from_json
+        Category: typical/error
+        Input: custom bike; then a JSON object that is not an encoded bike
+        Output: identical state; ValueError for the foreign payload
+        """
+        eb = self._make_custom_bike()
+        self.assertEqual(ElectricBike.from_json(eb.to_json()).__dict__, eb.__dict__)
+        with self.assertRaises(ValueError):
+            ElectricBike.from_json('{"name": "Bike"}')
+
+    def test_from_json_rejects_malformed_fields(self):
+        """
+        Unit: ElectricBike.from_json
+        Category: error
+        Input: right field count but wrong types or broken invariants
+               (discount 1, selected color not available, assist 6,
+               is_active as a string), non-JSON text
+        Output: raises ValueError for every payload
+        """
+        good = ["Bike", 1.0, 1, 1.0, 400, 3, 0.1, True, "a", ["a"], {"x": True}]
+        self.assertEqual(ElectricBike.from_json(dumps_json(good)).get_name(), "Bike")
+        overrides = [
+            (0, 5), (1, -1), (2, 1.5), (3, 0), (4, "400"), (5, 6), (6, 1),
+            (7, "yes"), (8, "zz"), (9, []), (9, [1]), (10, {"x": 1}), (10, 5),
+        ]
+        for index, value in overrides:
+            fields = list(good)
+            fields[index] = value
+            with self.subTest(index=index, value=value):
+                with self.assertRaises(ValueError):
+                    ElectricBike.from_json(dumps_json(fields))
+        for bad in ("[1,2,3,4,5,6,7,8,9,[],[]]", "not json", "{}"):
+            with self.subTest(bad=bad):
+                with self.assertRaises(ValueError):
+                    ElectricBike.from_json(bad)
+
+    def test_loads_bikes_json_rejects_bad_indexes(self):
+        """
+        Unit: loads_bikes_json
+        Category: error
+        Input: payloads with negative, out-of-range and bool table indexes,
+               and a decoded bike whose discount breaks the invariant
+        Output: raises ValueError
+        """
+        row = [0, 0, 1.0, 1, 1.0, 400, 3, 0.0, True, 0]
+        cases = ((-1, 0, 0.0), (5, 0, 0.0), (0, True, 0.0), (0, 0, 1.5))
+        for name_index, selected, pct in cases:
+            bad_row = list(row)
+            bad_row[0], bad_row[9], bad_row[7] = name_index, selected, pct
+            payload = {
+                "v": 1,
+                "strings": ["Bike", "black"],
+                "shapes": [[[1], []]],
+                "bikes": [bad_row],
+            }
+            with self.subTest(row=bad_row):
+                with self.assertRaises(ValueError):
+                    loads_bikes_json(dumps_json(payload))
+
+    def test_loads_bikes_rejects_oversized_shape_header(self):
+        """
+        Unit: loads_bikes
+        Category: error/resources
+        Input: 17-byte payloads whose shape headers claim ~65535 colors/features
+        Output: ValueError; no Struct built or cached for the bogus counts
+        """
+        from mse240_a1.src import electric_bike
+
+        for n_colors in range(65500, 65535):
+            payload = struct.pack("<2sBIII", b"EB", 1, 0, 1, 0)
+            payload += struct.pack("<HH", n_colors, 65535)
+            with self.assertRaises(ValueError):
+                loads_bikes(payload)
+            self.assertNotIn((n_colors, 65535), electric_bike._shape_tail_cache)
+        self.assertLessEqual(
+            len(electric_bike._shape_tail_cache), electric_bike._SHAPE_TAIL_CACHE_MAX
+        )
+
+    def test_dumps_bikes_shares_strings(self):
+        """
+        Unit: dumps_bikes / loads_bikes
+        Category: typical/size
+        Input: 100 bikes with the default colors and features
+        Output: round trip preserves order and state; payload grows by
+                less per bike than a standalone to_bytes() payload
+        """
+        bikes = [ElectricBike(f"Bike {i}", 100.0 + i, stock=i) for i in range(100)]
+        data = dumps_bikes(bikes)
+        decoded = loads_bikes(data)
+        self.assertEqual([b.__dict__ for b in decoded], [b.__dict__ for b in bikes])
+        self.assertLess(len(data), 100 * len(bikes[0].to_bytes()) // 2)
+        decoded[0].add_color("pink")
+        self.assertNotIn("pink", decoded[1].get_available_colors())
+
+    def test_dumps_bikes_json_round_trip(self):
+        """
+        Unit: dumps_bikes_json / loads_bikes_json
+        Category: typical/error
+        Input: mixed catalog; then a payload with the wrong version
+        Output: identical states in order; ValueError for the bad version
+        """
+        bikes = [self._make_custom_bike(), ElectricBike("Bike", 10.0), self._make_custom_bike()]
+        decoded = loads_bikes_json(dumps_bikes_json(bikes))
+        self.assertEqual([b.__dict__ for b in decoded], [b.__dict__ for b in bikes])
+        with self.assertRaises(ValueError):
+            loads_bikes_json('{"v": 0, "strings": [], "shapes": [], "bikes": []}')
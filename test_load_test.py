@@ -0,0 +1,82 @@
+import unittest
+from mse240_a1.analysis.load_test import (
+    DEFAULT_MIX,
+    MODELS,
+    build_catalog,
+    format_report,
+    make_plan,
+    percentile,
+    run_model,
+)
+
+
+class TestLoadTest(unittest.TestCase):
+    """Unit tests for the storefront load-testing harness"""
+
+    def test_percentile_nearest_rank(self):
+        """
+        Unit: percentile
+        Category: typical/bounds/error
+        Input: values 1..100; pct 0, 50, 99, 100; empty list; pct 101
+        Output: 1, 50, 99, 100; ValueError for the bad inputs
+        """
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+        with self.assertRaises(ValueError):
+            percentile(values, 101)
+
+    def test_make_plan_is_deterministic(self):
+        """
+        Unit: build_catalog / make_plan
+        Category: typical
+        Input: same seed twice, then a different seed
+        Output: identical plans for the same seed; ops drawn from the mix
+        """
+        skus = list(build_catalog(20))
+        plan = make_plan(skus, 500, DEFAULT_MIX, seed=3)
+        self.assertEqual(plan, make_plan(skus, 500, DEFAULT_MIX, seed=3))
+        self.assertNotEqual(plan, make_plan(skus, 500, DEFAULT_MIX, seed=4))
+        self.assertLessEqual({op for op, _, _ in plan}, set(DEFAULT_MIX))
+        self.assertLessEqual({sku for _, sku, _ in plan}, set(skus))
+
+    def test_run_model_each_model(self):
+        """
+        Unit: run_model / format_report
+        Category: smoke
+        Input: 50 bikes, 2 workers x 300 ops for every model
+        Output: 600 ops each, positive throughput, report rows; no failed ops
+                outside threads (only threads can race on a shared bike)
+        """
+        results = {}
+        for model in MODELS:
+            with self.subTest(model=model):
+                metrics = run_model(model, n_bikes=50, workers=2, ops_per_worker=300)
+                self.assertEqual(metrics["ops"], 600)
+                if model != "threads":
+                    self.assertEqual(metrics["errors"], 0)
+                self.assertGreater(metrics["ops_per_sec"], 0)
+                self.assertLessEqual(metrics["p50_us"], metrics["p99_us"])
+                self.assertLessEqual(metrics["p99_us"], metrics["max_us"])
+                results[model] = metrics
+        report = format_report(results)
+        for model in MODELS:
+            self.assertIn(model, report)
+
+    def test_run_model_rejects_bad_arguments(self):
+        """
+        Unit: run_model
+        Category: error
+        Input: unknown model; zero workers; yield_every=0
+        Output: raises ValueError
+        """
+        with self.assertRaises(ValueError):
+            run_model("fibers")
+        with self.assertRaises(ValueError):
+            run_model("threads", workers=0)
+        with self.assertRaises(ValueError):
+            run_model("asyncio", yield_every=0)
@@ -0,0 +1,216 @@
+import gc
+import unittest
+import weakref
+from mse240_a1.src.electric_bike import ElectricBike
+from mse240_a1.src.pricing import PricingEngine, Promotion, Region
+
+
+def _regions():
+    return [
+        Region("CA", "CAD", fx_rate=1.0, tax_rate=0.13),
+        Region(
+            "US",
+            "USD",
+            fx_rate=0.75,
+            tax_rate=0.0,
+            promotions=[
+                Promotion("spring", percent_off=0.10),
+                Promotion("loyalty", amount_off=50.0, skus=["EB-1"]),
+            ],
+        ),
+    ]
+
+
+class TestPricingEngine(unittest.TestCase):
+    """Unit tests for Promotion, Region and PricingEngine"""
+
+    def setUp(self):
+        self.bike1 = ElectricBike("Bike 1", 1000.0, stock=1)
+        self.bike2 = ElectricBike("Bike 2", 2000.0, stock=1, discount_percent=0.5)
+        self.engine = PricingEngine(_regions())
+        self.engine.add_bike("EB-1", self.bike1)
+        self.engine.add_bike("EB-2", self.bike2)
+
+    def test_get_price_typical(self):
+        """
+        Unit: PricingEngine.get_price
+        Category: typical
+        Input: CA (13% tax) and US (0.75 fx, 10% off, $50 off EB-1 only)
+        Output: 1130.00/1130.00 in CA; 625.00/675.00 in US
+        """
+        self.assertEqual(self.engine.get_price("EB-1", "CA"), 1130.0)
+        self.assertEqual(self.engine.get_price("EB-2", "CA"), 1130.0)
+        self.assertEqual(self.engine.get_price("EB-1", "US"), 625.0)
+        self.assertEqual(self.engine.get_price("EB-2", "US"), 675.0)
+
+    def test_set_price_recomputes_only_that_row(self):
+        """
+        Unit: PricingEngine price listener
+        Category: incremental
+        Input: bike1.set_price(2000); bike2.set_discount_percent(0.0)
+        Output: each change recomputes one row (2 regions); prices updated
+        """
+        before = self.engine.get_rows_recomputed()
+        self.bike1.set_price(2000.0)
+        self.assertEqual(self.engine.get_rows_recomputed() - before, 2)
+        self.assertEqual(self.engine.get_price("EB-1", "CA"), 2260.0)
+        self.assertEqual(self.engine.get_price("EB-1", "US"), 1300.0)
+        self.assertEqual(self.engine.get_price("EB-2", "CA"), 1130.0)
+
+        self.bike2.set_discount_percent(0.0)
+        self.assertEqual(self.engine.get_rows_recomputed() - before, 4)
+        self.assertEqual(self.engine.get_price("EB-2", "US"), 1350.0)
+
+    def test_invalid_setter_does_not_recompute(self):
+        """
+        Unit: PricingEngine price listener
+        Category: error
+        Input: bike1.set_price(-1)
+        Output: ValueError; no rows recomputed; price unchanged
+        """
+        before = self.engine.get_rows_recomputed()
+        with self.assertRaises(ValueError):
+            self.bike1.set_price(-1)
+        self.assertEqual(self.engine.get_rows_recomputed(), before)
+        self.assertEqual(self.engine.get_price("EB-1", "CA"), 1130.0)
+
+    def test_set_region_recomputes_only_that_column(self):
+        """
+        Unit: PricingEngine.set_region
+        Category: incremental
+        Input: replace CA with a 5% tax; add EU region
+        Output: 2 prices recomputed per region change; other region untouched
+        """
+        before = self.engine.get_rows_recomputed()
+        self.engine.set_region(Region("CA", "CAD", tax_rate=0.05))
+        self.assertEqual(self.engine.get_rows_recomputed() - before, 2)
+        self.assertEqual(self.engine.get_price("EB-1", "CA"), 1050.0)
+        self.assertEqual(self.engine.get_price("EB-1", "US"), 625.0)
+
+        self.engine.set_region(Region("EU", "EUR", fx_rate=0.68, tax_rate=0.2))
+        self.assertEqual(self.engine.get_price("EB-2", "EU"), 816.0)
+        self.assertEqual(sorted(self.engine.get_region_codes()), ["CA", "EU", "US"])
+
+    def test_promotions_floor_at_zero(self):
+        """
+        Unit: Region.price_for
+        Category: bounds
+        Input: $5000 off a $1000 bike
+        Output: 0.0, never negative
+        """
+        region = Region("XX", "CAD", promotions=[Promotion("free", amount_off=5000)])
+        self.engine.set_region(region)
+        self.assertEqual(self.engine.get_price("EB-1", "XX"), 0.0)
+
+    def test_remove_bike_and_region(self):
+        """
+        Unit: PricingEngine.remove_bike / remove_region
+        Category: typical/error
+        Input: remove EB-1, then change its price; remove US
+        Output: EB-1 gone from tables and no longer tracked; unknown lookups raise
+        """
+        self.engine.remove_bike("EB-1")
+        before = self.engine.get_rows_recomputed()
+        self.bike1.set_price(10.0)
+        self.assertEqual(self.engine.get_rows_recomputed(), before)
+        self.assertNotIn("EB-1", self.engine)
+        self.assertNotIn("EB-1", self.engine.get_region_prices("CA"))
+        with self.assertRaises(ValueError):
+            self.engine.get_price("EB-1", "CA")
+        with self.assertRaises(ValueError):
+            self.engine.remove_bike("EB-1")
+
+        self.engine.remove_region("US")
+        with self.assertRaises(ValueError):
+            self.engine.get_price("EB-2", "US")
+        with self.assertRaises(ValueError):
+            self.engine.get_region_prices("US")
+        with self.assertRaises(ValueError):
+            self.engine.remove_region("US")
+
+    def test_dropped_engine_is_collected_and_detached(self):
+        """
+        Unit: PricingEngine price listener
+        Category: lifetime
+        Input: engine tracking a bike is dropped; then the bike's price changes
+        Output: engine is garbage-collected; its listener removes itself
+        """
+        bike = ElectricBike("Bike", 1000.0, stock=1)
+        engine = PricingEngine(_regions())
+        engine.add_bike("EB-9", bike)
+        engine_ref = weakref.ref(engine)
+        del engine
+        gc.collect()
+        self.assertIsNone(engine_ref())
+        self.assertEqual(len(bike._price_listeners), 1)
+        bike.set_price(1500.0)
+        self.assertEqual(bike._price_listeners, ())
+
+    def test_close_detaches_listeners(self):
+        """
+        Unit: PricingEngine.close / context manager
+        Category: state
+        Input: close(); then change a tracked bike's price
+        Output: no listeners left on either bike; nothing recomputed; empty engine
+        """
+        with self.engine as engine:
+            pass
+        before = engine.get_rows_recomputed()
+        self.bike1.set_price(10.0)
+        self.assertEqual(engine.get_rows_recomputed(), before)
+        self.assertEqual(self.bike1._price_listeners, ())
+        self.assertEqual(self.bike2._price_listeners, ())
+        self.assertEqual(len(engine), 0)
+        self.assertEqual(dict(engine.get_region_prices("CA")), {})
+
+    def test_readd_sku_replaces_bike(self):
+        """
+        Unit: PricingEngine.add_bike
+        Category: state
+        Input: add a new bike under EB-1, then change the old bike's price
+        Output: table follows the new bike; old bike no longer tracked
+        """
+        new_bike = ElectricBike("Bike 1b", 500.0, stock=1)
+        self.engine.add_bike("EB-1", new_bike)
+        self.assertEqual(self.engine.get_price("EB-1", "CA"), 565.0)
+        self.bike1.set_price(9000.0)
+        self.assertEqual(self.engine.get_price("EB-1", "CA"), 565.0)
+        self.assertEqual(len(self.engine), 2)
+
+    def test_region_prices_view_is_read_only(self):
+        """
+        Unit: PricingEngine.get_region_prices
+        Category: type error
+        Input: assign into the returned mapping
+        Output: raises TypeError
+        """
+        view = self.engine.get_region_prices("CA")
+        self.assertEqual(dict(view), {"EB-1": 1130.0, "EB-2": 1130.0})
+        with self.assertRaises(TypeError):
+            view["EB-1"] = 0.0
+
+    def test_constructor_validation(self):
+        """
+        Unit: Promotion.__init__ / Region.__init__ / PricingEngine.add_bike
+        Category: error
+        Input: out-of-range rates, wrong types, a bare string for skus
+        Output: ValueError for ranges; TypeError for types
+        """
+        with self.assertRaises(ValueError):
+            Promotion("p", percent_off=1.0)
+        with self.assertRaises(ValueError):
+            Promotion("p", amount_off=-1)
+        with self.assertRaises(TypeError):
+            Promotion("  ")
+        with self.assertRaises(TypeError):
+            Promotion("p", amount_off=10, skus="EB-1")
+        with self.assertRaises(ValueError):
+            Region("CA", "CAD", fx_rate=0)
+        with self.assertRaises(ValueError):
+            Region("CA", "CAD", tax_rate=-0.1)
+        with self.assertRaises(TypeError):
+            Region("CA", "CAD", promotions=["spring"])
+        with self.assertRaises(TypeError):
+            self.engine.set_region("CA")
+        with self.assertRaises(TypeError):
+            self.engine.add_bike("EB-3", object())